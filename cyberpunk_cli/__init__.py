@@ -17,20 +17,15 @@ Full decorator framework:
         print("Hello cyberpunk world!")
 """
 
-# Core components
-from .menu import CyberpunkMenu, MenuOption
-from .themes import theme_manager, BaseTheme
-from .themes.fallout_theme import FalloutTheme
-from .themes.matrix_theme import MatrixTheme  
-from .themes.tron_theme import TronTheme
-
-# Main decorator system
+# Main decorator system (imports neither Rich nor Click)
 from .decorator import cyberpunk, option, group, enhance_click_app
 
 # Auto-enhancement for Click (when just importing cyberpunk_cli)
 import sys
 
-try:
+
+def _enhance_click():
+    """Replace click.command/click.group with auto-enhancing versions"""
     import click as _click
     
     # Store original Click decorators
@@ -64,10 +59,44 @@ try:
     # Enable zero-effort enhancement by replacing Click decorators
     _click.command = _auto_enhance_command
     _click.group = _auto_enhance_group
-    
-except ImportError:
-    # Click not available, skip auto-enhancement
-    pass
+
+
+# The enhanced decorators only differ from Click's when there are no CLI
+# args, so a CLI invoked with arguments does not need to import Click here
+if "click" in sys.modules or len(sys.argv) <= 1:
+    try:
+        _enhance_click()
+    except ImportError:
+        # Click not available, skip auto-enhancement
+        pass
+
+# Rendering components are imported on first access, keeping
+# "import cyberpunk_cli" free of Rich and every theme module
+_LAZY_ATTRIBUTES = {
+    "CyberpunkMenu": ".menu",
+    "MenuOption": ".menu",
+    "InputSource": ".input_source",
+    "TerminalInput": ".input_source",
+    "ScriptedInput": ".input_source",
+    "RecordingInput": ".input_source",
+    "CommandIndex": ".command_index",
+    "theme_manager": ".themes",
+    "BaseTheme": ".themes",
+    "FalloutTheme": ".themes.fallout_theme",
+    "MatrixTheme": ".themes.matrix_theme",
+    "TronTheme": ".themes.tron_theme",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "1.0.0"
 __author__ = "Cambrian"
@@ -77,6 +106,11 @@ __all__ = [
     # Core classes
     "CyberpunkMenu",
     "MenuOption", 
+    "InputSource",
+    "TerminalInput",
+    "ScriptedInput",
+    "RecordingInput",
+    "CommandIndex",
     "theme_manager",
     "BaseTheme",
     "FalloutTheme",
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Command Index - Persisted command tree of a Click app
+
+Building a menu for a Click group means listing its subcommands, and a
+group that loads them lazily from many modules imports every one of them
+to do so. The index records the tree once (names, help, params and their
+choices, and the module that defines each command) in a marshal file
+under the user cache directory. Later runs only stat the recorded modules
+and build the menu from the index without importing any subcommand.
+
+A module whose mtime or size changed is hashed; if its contents really
+changed, only the commands it defines are extracted again, reusing the
+stored entries of everything else. Entries are plain dicts:
+    {"name", "help", "short_help", "hidden", "module", "params", "commands"}
+with "commands" mapping subcommand names to entries (None for a leaf).
+"""
+
+import os
+import sys
+import hashlib
+import marshal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+# Bumped whenever the layout of the persisted index changes
+INDEX_FORMAT = 1
+
+# (path, mtime_ns, size, sha1 of the contents) per module name
+ModuleSignature = Tuple[str, int, int, str]
+
+
+def default_index_path(command) -> Path:
+    """Cache file for a root command, unique per defining file and command name"""
+    module = _command_module(command)
+    source = getattr(sys.modules.get(module), "__file__", None) or module or ""
+    digest = hashlib.sha1(f"{os.path.abspath(source)}:{command.name}".encode()).hexdigest()[:12]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "cyberpunk-cli" / f"commands-{command.name}-{digest}.marshal"
+
+
+def command_items(entry: Dict[str, Any], path: Tuple[str, ...] = ()) -> Iterator[tuple]:
+    """Menu items for an entry's subcommands (see cyberpunk_cli.submenu.populate)
+
+    Option keys are the space-separated command path ("db migrate"); groups
+    become submenus that are only built when opened.
+    """
+    for name, child in (entry.get("commands") or {}).items():
+        if child["hidden"]:
+            continue
+        child_path = path + (name,)
+        description = child["short_help"] or f"Run {' '.join(child_path)}"
+        if child["commands"] is None:
+            yield (" ".join(child_path), name, description)
+        else:
+            yield (" ".join(child_path), name, description,
+                   lambda child=child, child_path=child_path: command_items(child, child_path))
+
+
+class CommandIndex:
+    """Command tree of a Click command, persisted and revalidated per module"""
+
+    def __init__(self, command, path=None):
+        self.command = command                    # Live root command (already imported)
+        self.path = Path(path) if path is not None else default_index_path(command)
+        self.modules: Dict[str, ModuleSignature] = {}
+        self.extracted: Set[str] = set()          # Modules re-extracted by the last load()
+
+    def load(self) -> Dict[str, Any]:
+        """Get the command tree, extracting only what changed since it was stored"""
+        self.extracted = set()
+        stored = self._read()
+        if stored is None:
+            self.modules = {}
+            tree = self._extract(self.command, self._context(self.command), None, set())
+            self._store(tree)
+            return tree
+
+        tree, self.modules = stored
+        changed, touched = self._changed_modules()
+        if changed:
+            tree = self._refresh(tree, lambda: (self.command, self._context(self.command)), changed)
+        if changed or touched:
+            self._store(tree)
+        return tree
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Extract the whole tree again, ignoring the stored index"""
+        self.modules = {}
+        self.extracted = set()
+        tree = self._extract(self.command, self._context(self.command), None, set())
+        self._store(tree)
+        return tree
+
+    def _changed_modules(self) -> Tuple[Set[str], bool]:
+        """Modules whose contents changed, and whether any signature needs storing"""
+        changed: Set[str] = set()
+        touched = False
+        for module, (path, mtime, size, digest) in list(self.modules.items()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                changed.add(module)
+                continue
+            if (stat.st_mtime_ns, stat.st_size) == (mtime, size):
+                continue
+            if _file_digest(path) == digest:
+                # Touched but not edited (checkout, copy): keep the entries
+                self.modules[module] = (path, stat.st_mtime_ns, stat.st_size, digest)
+                touched = True
+            else:
+                changed.add(module)
+        return changed, touched
+
+    def _refresh(self, entry: Dict[str, Any], resolve: Callable[[], tuple],
+                 changed: Set[str]) -> Dict[str, Any]:
+        """Entry with the commands defined in changed modules extracted again
+
+        resolve() returns the live (command, context) for the entry; it is
+        only called, importing what it takes, when something below changed.
+        """
+        if entry["module"] in changed:
+            command, context = resolve()
+            return self._extract(command, context, entry, changed)
+        children = entry["commands"]
+        if not children:
+            return entry
+
+        commands = {}
+        for name, child in children.items():
+            child = self._refresh(child, _memoized(lambda name=name: self._subcommand(resolve(), name)),
+                                  changed)
+            if child is not None:
+                commands[name] = child
+        return dict(entry, commands=commands)
+
+    def _extract(self, command, context, previous: Optional[Dict[str, Any]],
+                 changed: Set[str]) -> Optional[Dict[str, Any]]:
+        """Entry for a live command, reusing previous entries of unchanged subcommands"""
+        if command is None:
+            return None
+        module = _command_module(command)
+        self._track(module)
+        entry = {
+            "name": command.name,
+            "help": command.help or "",
+            "short_help": command.get_short_help_str(),
+            "hidden": bool(getattr(command, "hidden", False)),
+            "module": module,
+            "params": [_param_entry(param) for param in command.params],
+            "commands": None,
+        }
+        if hasattr(command, "list_commands"):
+            stored = (previous or {}).get("commands") or {}
+            commands = {}
+            for name in command.list_commands(context):
+                resolve = _memoized(lambda name=name: self._subcommand((command, context), name))
+                if name in stored:
+                    child = self._refresh(stored[name], resolve, changed)
+                else:
+                    child = self._extract(*resolve(), None, changed)
+                if child is not None:
+                    commands[name] = child
+            entry["commands"] = commands
+        return entry
+
+    def _subcommand(self, parent: tuple, name: str) -> tuple:
+        """Live (command, context) of a subcommand, importing it if it is lazy"""
+        command, context = parent
+        if command is None:
+            return None, None
+        subcommand = command.get_command(context, name)
+        if subcommand is None:
+            return None, None
+        return subcommand, self._context(subcommand, name, context)
+
+    @staticmethod
+    def _context(command, name: Optional[str] = None, parent=None):
+        import click
+        return click.Context(command, info_name=name or command.name, parent=parent)
+
+    def _track(self, module: Optional[str]) -> None:
+        """Record the signature of a module commands were extracted from"""
+        if module is None or module in self.extracted:
+            return
+        self.extracted.add(module)
+        path = getattr(sys.modules.get(module), "__file__", None)
+        if not path:
+            return  # Built-in or frozen, never changes under us
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        self.modules[module] = (path, stat.st_mtime_ns, stat.st_size, _file_digest(path))
+
+    def _read(self) -> Optional[Tuple[Dict[str, Any], Dict[str, ModuleSignature]]]:
+        """Load the stored index if it was written by this format for this command"""
+        try:
+            with open(self.path, 'rb') as f:
+                fmt, name, tree, modules = marshal.loads(f.read())  # One read, not one per object
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if fmt != INDEX_FORMAT or name != self.command.name:
+            return None
+        return tree, {module: tuple(signature) for module, signature in modules.items()}
+
+    def _store(self, tree: Dict[str, Any]) -> None:
+        """Write the index atomically, dropping modules no command comes from any more"""
+        used = set()
+        _collect_modules(tree, used)
+        self.modules = {module: signature for module, signature in self.modules.items()
+                        if module in used}
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary, 'wb') as f:
+                marshal.dump((INDEX_FORMAT, self.command.name, tree, self.modules), f)
+            os.replace(temporary, self.path)
+        except (OSError, ValueError):
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
+
+
+def _memoized(resolve: Callable[[], tuple]) -> Callable[[], tuple]:
+    """Call resolve at most once, however many changed subcommands need it"""
+    result = []
+
+    def cached():
+        if not result:
+            result.append(resolve())
+        return result[0]
+
+    return cached
+
+
+def _command_module(command) -> Optional[str]:
+    """Module defining a command: its callback's, else its class's"""
+    callback = getattr(command, "callback", None)
+    if callback is not None:
+        return getattr(callback, "__module__", None)
+    return type(command).__module__
+
+
+def _param_entry(param) -> Dict[str, Any]:
+    """Plain-data description of a Click parameter"""
+    import click
+    choices = None
+    if isinstance(param.type, click.Choice):
+        choices = [choice if isinstance(choice, str) else getattr(choice, "name", str(choice))
+                   for choice in param.type.choices]
+    default = param.default
+    if not isinstance(default, (str, int, float, bool, type(None))):
+        default = None  # Callables, sentinels and objects are resolved at invocation
+    return {
+        "name": param.name,
+        "opts": list(param.opts),
+        "kind": param.param_type_name,
+        "help": getattr(param, "help", None) or "",
+        "type": param.type.name,
+        "choices": choices,
+        "is_flag": bool(getattr(param, "is_flag", False)),
+        "required": bool(param.required),
+        "default": default,
+    }
+
+
+def _collect_modules(entry: Optional[Dict[str, Any]], modules: Set[str]) -> None:
+    if entry is None:
+        return
+    modules.add(entry["module"])
+    for child in (entry["commands"] or {}).values():
+        _collect_modules(child, modules)
+
+
+def _file_digest(path: str) -> str:
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return ""
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Config Cache - Parse JSON configuration once per process
+
+Every cyberpunk decorator reads themes/theme_config.json, and importing
+cyberpunk_cli wraps every Click command in one. The cache parses each file
+once and afterwards only stats it, re-reading when its mtime or size
+changes. It can also persist the parsed form as a marshal file next to the
+JSON, which a fresh process loads faster than it parses the JSON; set
+CYBERPUNK_CLI_CONFIG_CACHE=1 to enable that for the global cache.
+"""
+
+import os
+import json
+import marshal
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+# Bumped whenever the layout of the persisted file changes
+CACHE_FORMAT = 1
+CACHE_SUFFIX = ".marshal"
+
+# Environment variable that turns on the persisted copy for the global cache
+PERSIST_ENV = "CYBERPUNK_CLI_CONFIG_CACHE"
+
+
+class ConfigCache:
+    """Process-wide cache of parsed JSON files, revalidated by mtime and size"""
+
+    def __init__(self, persist: bool = False):
+        self.persist = persist   # Also keep a pre-parsed copy on disk
+        self._entries: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self.loads = 0           # Number of times a file was actually parsed
+
+    def get(self, path) -> Any:
+        """Get the parsed contents of a JSON file (shared, treat as read-only)"""
+        path = os.fspath(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        data = self._load_persisted(path, signature) if self.persist else None
+        if data is None:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            self.loads += 1
+            if self.persist:
+                self._store_persisted(path, signature, data)
+
+        self._entries[path] = (signature, data)
+        return data
+
+    def invalidate(self, path=None) -> None:
+        """Forget one cached file, or all of them"""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(os.fspath(path), None)
+
+    def _load_persisted(self, path: str, signature: Tuple[int, int]) -> Any:
+        """Load the marshal copy if it was made from this version of the file"""
+        try:
+            with open(path + CACHE_SUFFIX, 'rb') as f:
+                fmt, stored_signature, data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if fmt != CACHE_FORMAT or tuple(stored_signature) != signature:
+            return None
+        return data
+
+    def _store_persisted(self, path: str, signature: Tuple[int, int], data: Any) -> None:
+        """Write the marshal copy atomically; read-only installs just skip it"""
+        target = path + CACHE_SUFFIX
+        temporary = f"{target}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, 'wb') as f:
+                marshal.dump((CACHE_FORMAT, signature, data), f)
+            os.replace(temporary, target)
+        except (OSError, ValueError):
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
+
+
+THEME_CONFIG_PATH = Path(__file__).parent / "themes" / "theme_config.json"
+
+# Global config cache shared by all decorators
+config_cache = ConfigCache(persist=os.environ.get(PERSIST_ENV, "").lower() in ("1", "true", "yes", "on"))
+
+
+def load_theme_config() -> Dict[str, Any]:
+    """Load shared theme configuration (cached, treat as read-only)"""
+    return config_cache.get(THEME_CONFIG_PATH)
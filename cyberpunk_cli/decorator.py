@@ -4,23 +4,17 @@ Cyberpunk CLI Decorator System
 Unified decorator that works with or without Click, with easy title customization
 """
 
-import json
 import sys
 import os
 import inspect
-from pathlib import Path
 from typing import Optional, Callable, Dict, Any, List
 from functools import wraps
-import click
-from .menu import CyberpunkMenu
-from .themes import theme_manager
 
+from .config import load_theme_config
 
-def load_theme_config() -> Dict[str, Any]:
-    """Load shared theme configuration"""
-    config_path = Path(__file__).parent / "themes" / "theme_config.json"
-    with open(config_path, 'r') as f:
-        return json.load(f)
+# Click, the menu and the themes (and with them Rich) are imported inside the
+# methods that need them, so decorating a function stays cheap for CLIs that
+# are invoked with arguments and never show a menu
 
 
 class CyberpunkDecorator:
@@ -30,19 +24,30 @@ class CyberpunkDecorator:
                  title: Optional[str] = None,
                  theme: str = "loki", 
                  theme_switching: bool = True,
-                 click_integration: str = "override"):
+                 click_integration: str = "override",
+                 warmup: Optional[Callable[[], Any]] = None,
+                 splash_time: float = 0.5):
         """
         Args:
             title: Custom terminal title (auto-detected from function if None)
             theme: Default theme name
             theme_switching: Allow Ctrl+T theme switching
             click_integration: "override" (default), "integrate", or "disable"
+            warmup: Expensive app initialization to run while the splash shows
+            splash_time: Minimum splash duration in seconds (0 = no splash)
         """
         self.title = title
         self.theme = theme
         self.theme_switching = theme_switching
         self.click_integration = click_integration
-        self.theme_config = load_theme_config()
+        self.warmup = warmup
+        self.splash_time = splash_time
+        self._command_trees: Dict[Callable, Dict[str, Any]] = {}  # Per decorated command
+        
+    @property
+    def theme_config(self) -> Dict[str, Any]:
+        """Shared theme configuration, only loaded when a menu needs it"""
+        return load_theme_config()
         
     def __call__(self, func: Callable) -> Callable:
         """Main decorator function"""
@@ -94,27 +99,86 @@ class CyberpunkDecorator:
         else:
             return original_func
     
+    def _command_tree(self, func: Callable) -> Optional[Dict[str, Any]]:
+        """Command tree of a Click command from its on-disk index, None for plain functions
+        
+        The index lists lazily loaded subcommands without importing them and
+        is only re-extracted for modules that changed since it was stored.
+        """
+        if not self._is_click_command(func):
+            return None  # Plain functions never need Click (which may not be installed)
+        import click
+        if not isinstance(func, click.Command):
+            return None
+        tree = self._command_trees.get(func)
+        if tree is None:
+            from .command_index import CommandIndex
+            tree = self._command_trees[func] = CommandIndex(func).load()
+        return tree
+    
     def _extract_click_options(self, func: Callable) -> List[Dict[str, Any]]:
         """Extract Click options to create menu items"""
+        tree = self._command_tree(func)
+        if tree is not None:
+            return [{
+                'name': param['name'],
+                'opts': param['opts'],
+                'help': param['help'] or f"Set {param['name']}",
+                'is_flag': param['is_flag'],
+                'choices': param['choices'],
+                'default': param['default']
+            } for param in tree['params'] if param['kind'] == 'option']
+        
+        import click
         options = []
         if hasattr(func, '__click_params__'):
             for param in func.__click_params__:
                 if isinstance(param, click.Option):
+                    choices = param.type.choices if isinstance(param.type, click.Choice) else None
                     options.append({
                         'name': param.name,
+                        'opts': list(param.opts),
                         'help': param.help or f"Set {param.name}",
                         'is_flag': param.is_flag,
+                        'choices': [str(choice) for choice in choices] if choices else None,
                         'default': param.default
                     })
         return options
     
     def _show_cyberpunk_interface(self, func: Callable, title: str, *args, **kwargs) -> Any:
         """Show the cyberpunk terminal interface"""
+        from .themes import theme_manager
         theme_manager.set_theme(self.theme)
-        menu = CyberpunkMenu(title, theme=self.theme)
+        menu = self._build_menu(func, title, self.theme)
         
-        # If it's a Click command, extract options as menu items
-        if self._is_click_command(func):
+        # Run the menu (warm-up only happens behind the first splash)
+        warmup = self.warmup
+        while True:
+            choice = menu.run(warmup=warmup)
+            warmup = None
+            
+            if choice is None:  # Exit
+                break
+            elif choice == "change_theme":
+                self._show_theme_selector()
+                menu = self._build_menu(func, title, theme_manager.get_theme().name)  # Recreate with new theme
+            else:
+                # Handle the selected option
+                return self._handle_menu_choice(func, choice, *args, **kwargs)
+    
+    def _build_menu(self, func: Callable, title: str, theme: str):
+        """Menu of a function's parameters, or of a Click group's subcommands"""
+        from .menu import CyberpunkMenu
+        menu = CyberpunkMenu(title, theme=theme, splash_time=self.splash_time)
+        
+        tree = self._command_tree(func)
+        if tree is not None and tree['commands'] is not None:
+            # Click group: subcommands from the index, nested groups as submenus
+            from .command_index import command_items
+            from .submenu import populate
+            populate(menu, command_items(tree))
+        elif self._is_click_command(func):
+            # Click command: its options as menu items
             click_options = self._extract_click_options(func)
             for option in click_options:
                 menu.add_option(
@@ -139,22 +203,12 @@ class CyberpunkDecorator:
             menu.add_option("change_theme", "Change Theme", "Switch cyberpunk theme")
         
         menu.add_exit()
-        
-        # Run the menu
-        while True:
-            choice = menu.run()
-            
-            if choice is None:  # Exit
-                break
-            elif choice == "change_theme":
-                self._show_theme_selector()
-                menu = CyberpunkMenu(title, theme=theme_manager.get_theme().name)  # Recreate with new theme
-            else:
-                # Handle the selected option
-                return self._handle_menu_choice(func, choice, *args, **kwargs)
+        return menu
     
     def _show_theme_selector(self):
         """Show theme selection interface"""
+        from .menu import CyberpunkMenu
+        from .themes import theme_manager
         themes = self.theme_config['themes']
         theme_menu = CyberpunkMenu("Theme Selector")
         
@@ -177,7 +231,13 @@ class CyberpunkDecorator:
         """Handle menu selection and execute function"""
         if self._is_click_command(func):
             # For Click commands, we need to simulate CLI args
-            sys.argv = [sys.argv[0], f'--{choice}']
+            tree = self._command_tree(func)
+            if tree is not None and tree['commands'] is not None:
+                sys.argv = [sys.argv[0], *choice.split(' ')]  # Subcommand path
+            else:
+                option = next((option for option in self._extract_click_options(func)
+                               if option['name'] == choice), None)
+                sys.argv = [sys.argv[0], *(self._option_args(option) if option else [])]
             return func(*args, **kwargs)
         else:
             # For regular functions, prompt for parameter value
@@ -196,6 +256,17 @@ class CyberpunkDecorator:
                 
             return func(*args, **kwargs)
     
+    @staticmethod
+    def _option_args(option: Dict[str, Any]) -> List[str]:
+        """Command line for a chosen Click option: its flag, or the option and a prompted value"""
+        opts = option['opts']
+        flag = next((opt for opt in opts if opt.startswith('--')), opts[0])
+        if option['is_flag']:
+            return [flag]
+        hint = f" ({'/'.join(option['choices'])})" if option['choices'] else ""
+        value = input(f"Enter value for {flag}{hint}: ")
+        return [flag, value]
+    
     def _handle_basic_args(self, func: Callable, *args, **kwargs) -> Any:
         """Handle basic command line arguments for non-Click functions"""
         # Simple argument parsing for non-Click functions
@@ -207,7 +278,9 @@ class CyberpunkDecorator:
 def cyberpunk(title: Optional[str] = None,
               theme: str = "loki", 
               theme_switching: bool = True,
-              click_integration: str = "override") -> Callable:
+              click_integration: str = "override",
+              warmup: Optional[Callable[[], Any]] = None,
+              splash_time: float = 0.5) -> Callable:
     """
     Cyberpunk CLI decorator that works with or without Click
     
@@ -216,6 +289,8 @@ def cyberpunk(title: Optional[str] = None,
         theme: Default theme ("loki", "matrix", "fallout", "tron")
         theme_switching: Enable Ctrl+T theme switching
         click_integration: "override" (replace Click), "integrate" (enhance Click), "disable"
+        warmup: Callable run in the background while the loading splash shows
+        splash_time: Minimum splash duration in seconds (0 = no splash)
     
     Examples:
         # Basic usage
@@ -235,8 +310,14 @@ def cyberpunk(title: Optional[str] = None,
         @click.option('--env', help='Environment')
         def deploy(env):
             print(f"Deploying to {env}")
+        
+        # Load models while the splash is up
+        @cyberpunk(warmup=load_models, splash_time=0.2)
+        def analyze():
+            print("Analyzing...")
     """
-    return CyberpunkDecorator(title, theme, theme_switching, click_integration)
+    return CyberpunkDecorator(title, theme, theme_switching, click_integration,
+                              warmup, splash_time)
 
 
 # Convenience functions for common patterns
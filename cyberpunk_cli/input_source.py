@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Input Sources - Pluggable key input for cyberpunk menus
+
+A menu reads its keys through an InputSource. TerminalInput is the real
+keyboard and mouse; ScriptedInput replays a recorded session, with or
+without its original timing, so whole menu sessions run headless in CI;
+RecordingInput wraps another source and saves every key it delivers.
+
+Sessions are stored as JSON lines, one {"t": seconds, "key": "..."} per
+key, where t counts from the moment the source was entered.
+"""
+
+import os
+import sys
+import json
+import time
+import select
+from abc import ABC, abstractmethod
+from typing import IO, Iterable, List, Optional, Tuple, Union
+
+from .keys import KeyDecoder
+from .terminal import terminal_session
+
+
+def mouse_event(button: int, col: int, row: int, sgr: bool = False,
+                release: bool = False) -> str:
+    """Build a mouse report (button 0 = left click, 35 = hover, 64/65 = wheel up/down)
+
+    X10 reports by default, SGR 1006 reports (any coordinates) with sgr=True.
+    """
+    if sgr:
+        return f"\x1b[<{button};{col};{row}{'m' if release else 'M'}"
+    if release:
+        button = 3
+    return '\x1b[M' + chr(32 + button) + chr(32 + col) + chr(32 + row)
+
+
+class InputSource(ABC):
+    """Where a menu's keys come from (a context manager for the whole run)"""
+
+    def __enter__(self) -> "InputSource":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+    @abstractmethod
+    def read_keys(self, deadline: Optional[float] = None) -> List[str]:
+        """Wait for a key, then collect every key that arrives before deadline
+
+        Raises EOFError when the input is exhausted.
+        """
+        pass
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to timeout seconds (None = forever), True as soon as a key is ready"""
+        return True
+
+    def fileno(self) -> Optional[int]:
+        """File descriptor an event loop can watch, None if there is none"""
+        return None
+
+    def read_available(self) -> List[str]:
+        """Read the keys that are ready without blocking (used with fileno())"""
+        return []
+
+    def pending_timeout(self) -> Optional[float]:
+        """Seconds after which flush() should resolve a partial key, None if none"""
+        return None
+
+    def flush(self) -> List[str]:
+        """Resolve a partial key (such as a lone ESC) after pending_timeout()"""
+        return []
+
+
+class TerminalInput(InputSource):
+    """Keyboard and mouse input from the controlling terminal"""
+
+    def __init__(self, esc_timeout: Optional[float] = None, motion: bool = False):
+        self.decoder = KeyDecoder() if esc_timeout is None else KeyDecoder(esc_timeout)
+        self.motion = motion  # Ask the terminal to report pointer motion (hover)
+
+    def __enter__(self) -> "TerminalInput":
+        # One cbreak/mouse session for the whole run (shared with nested menus)
+        if not terminal_session.depth:
+            terminal_session.motion = self.motion
+        terminal_session.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        terminal_session.__exit__(exc_type, exc, tb)
+
+    def read_keys(self, deadline: Optional[float] = None) -> List[str]:
+        """Wait for a keypress, then collect every key that arrives before deadline
+
+        Keys that pile up while a frame is rendering (held arrow keys, pastes)
+        are returned together so the caller can apply all of them and render
+        only the final state. With no deadline, only keys that are already
+        pending are collected.
+        """
+        if sys.platform == 'win32':
+            try:
+                import msvcrt
+                keys = [msvcrt.getch().decode('utf-8')]
+                while msvcrt.kbhit():
+                    keys.append(msvcrt.getch().decode('utf-8'))
+                return keys
+            except ImportError:
+                return [input().strip() or '\n']
+
+        # Inside a run the session is already active and this costs nothing
+        with terminal_session:
+            if not terminal_session.active:
+                # Fallback to regular input for non-TTY environments
+                return [input().strip() or '\n']
+
+            fd = terminal_session.fd
+            keys = self._read(fd)
+            while not keys:
+                keys = self._read(fd)  # Only part of a key so far
+            while True:
+                timeout = 0.0 if deadline is None else max(0.0, deadline - time.monotonic())
+                if not select.select([fd], [], [], timeout)[0]:
+                    break
+                keys.extend(self._read(fd))
+            return keys
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        fd = self.fileno()
+        if fd is None:
+            return True
+        return bool(select.select([fd], [], [], timeout)[0])
+
+    def fileno(self) -> Optional[int]:
+        return terminal_session.fd if terminal_session.active else None
+
+    def read_available(self) -> List[str]:
+        data = os.read(terminal_session.fd, 4096)
+        if not data:
+            raise EOFError
+        return self.decoder.feed(data)
+
+    def pending_timeout(self) -> Optional[float]:
+        decoder = self.decoder
+        return decoder.esc_timeout if decoder.pending and not decoder.in_paste else None
+
+    def flush(self) -> List[str]:
+        return self.decoder.flush()
+
+    def _read(self, fd: int) -> List[str]:
+        """Read whatever input is available in one go and decode it
+
+        Blocks until at least one byte arrives. A partial escape sequence
+        waits esc_timeout for its remaining bytes; if none come it was a
+        lone ESC press.
+        """
+        data = os.read(fd, 4096)
+        if not data:
+            raise EOFError
+        decoder = self.decoder
+        keys = decoder.feed(data)
+        while decoder.pending:
+            timeout = None if decoder.in_paste else decoder.esc_timeout
+            if not select.select([fd], [], [], timeout)[0]:
+                keys.extend(decoder.flush())
+                break
+            data = os.read(fd, 4096)
+            if not data:
+                keys.extend(decoder.flush())
+                break
+            keys.extend(decoder.feed(data))
+        return keys
+
+
+# A scripted event: a key, or (seconds since start, key)
+ScriptEvent = Union[str, Tuple[float, str]]
+
+
+class ScriptedInput(InputSource):
+    """Replays a fixed sequence of keys, escape sequences and mouse events
+
+    By default every read returns the next key immediately, one key per
+    frame, so sessions run at full speed. With realtime=True each key is
+    delivered at its recorded time and keys due within a frame are
+    coalesced, like a real terminal. Raises EOFError once the script ends.
+    """
+
+    def __init__(self, events: Iterable[ScriptEvent], realtime: bool = False):
+        self.events: List[Tuple[Optional[float], str]] = [
+            (None, event) if isinstance(event, str) else (float(event[0]), event[1])
+            for event in events
+        ]
+        self.realtime = realtime
+        self.position = 0     # Index of the next event
+        self._start = time.monotonic()
+
+    @classmethod
+    def load(cls, path, realtime: bool = False) -> "ScriptedInput":
+        """Load a session saved by RecordingInput"""
+        events = []
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    event = json.loads(line)
+                    events.append((event["t"], event["key"]))
+        return cls(events, realtime)
+
+    @property
+    def remaining(self) -> int:
+        """Number of events not replayed yet"""
+        return len(self.events) - self.position
+
+    def __enter__(self) -> "ScriptedInput":
+        self._start = time.monotonic()
+        return self
+
+    def read_keys(self, deadline: Optional[float] = None) -> List[str]:
+        if not self.remaining:
+            raise EOFError
+        if not self.realtime:
+            self.position += 1
+            return [self.events[self.position - 1][1]]
+
+        self._sleep_until(self._due(self.position))
+        keys = [self.events[self.position][1]]
+        self.position += 1
+        while self.remaining:
+            due = self._due(self.position)
+            if due > time.monotonic() and (deadline is None or due > deadline):
+                break
+            self._sleep_until(due)
+            keys.append(self.events[self.position][1])
+            self.position += 1
+        return keys
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        if not self.realtime or not self.remaining:
+            return True
+        due = self._due(self.position)
+        if timeout is None or due - time.monotonic() <= timeout:
+            self._sleep_until(due)
+            return True
+        time.sleep(timeout)
+        return False
+
+    def _due(self, position: int) -> float:
+        """monotonic() time at which an event is delivered"""
+        offset = self.events[position][0]
+        return self._start + offset if offset is not None else 0.0
+
+    @staticmethod
+    def _sleep_until(when: float) -> None:
+        delay = when - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RecordingInput(InputSource):
+    """Passes keys through from another source while saving them for replay"""
+
+    def __init__(self, source: InputSource, path):
+        self.source = source
+        self.path = path
+        self._file: Optional[IO[str]] = None
+        self._start = time.monotonic()
+
+    def __enter__(self) -> "RecordingInput":
+        self.source.__enter__()
+        self._file = open(self.path, 'w')
+        self._start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        finally:
+            self.source.__exit__(exc_type, exc, tb)
+
+    def read_keys(self, deadline: Optional[float] = None) -> List[str]:
+        return self._record(self.source.read_keys(deadline))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.source.wait(timeout)
+
+    def fileno(self) -> Optional[int]:
+        return self.source.fileno()
+
+    def read_available(self) -> List[str]:
+        return self._record(self.source.read_available())
+
+    def pending_timeout(self) -> Optional[float]:
+        return self.source.pending_timeout()
+
+    def flush(self) -> List[str]:
+        return self._record(self.source.flush())
+
+    def _record(self, keys: List[str]) -> List[str]:
+        if self._file is not None:
+            offset = round(time.monotonic() - self._start, 4)
+            for key in keys:
+                self._file.write(json.dumps({"t": offset, "key": key}) + "\n")
+            self._file.flush()  # Keep the recording if the app dies mid-session
+        return keys
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Key Decoder - Incremental terminal input parser
+
+Terminal input arrives as a byte stream in which one key may be a single
+byte, a multi-byte UTF-8 character or an escape sequence of any length
+(PageUp is ESC [ 5 ~, Ctrl+Up is ESC [ 1 ; 5 A, an SGR mouse report is
+ESC [ < 0 ; 120 ; 40 M). KeyDecoder is fed whatever bytes os.read()
+returned and hands back every complete key, keeping a partial sequence
+until the rest arrives. A lone ESC cannot be told apart from the start of
+a sequence, so the reader calls flush() when no more bytes arrive within
+esc_timeout.
+
+Keys are returned as strings, with escape sequences kept whole:
+    '\\x1b[A'                        arrow keys (SS3 forms normalized to CSI)
+    '\\x1b[5~', '\\x1b[1;5A'           CSI sequences with parameters
+    '\\x1b[M' + 3 chars              X10 mouse report (bytes mapped 1:1 to chars)
+    '\\x1b[<0;10;5M'                 SGR 1006 mouse report
+    PASTE_START + text + PASTE_END  bracketed paste, as a single key
+    '\\x1bx'                         Alt+x
+
+parse_mouse() turns either kind of mouse report into a MouseEvent.
+"""
+
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+# Seconds to wait for the rest of a sequence before treating ESC as a key
+ESC_TIMEOUT = 0.05
+
+# Escape sequences longer than this are garbage; emit them and resynchronize
+MAX_SEQUENCE = 64
+
+PASTE_START = '\x1b[200~'
+PASTE_END = '\x1b[201~'
+_PASTE_START = PASTE_START.encode()
+_PASTE_END = PASTE_END.encode()
+
+_ESC = 0x1b
+
+# SS3 keys (ESC O x) sent in application cursor mode, as their CSI forms
+_SS3_KEYS = {ord(final): '\x1b[' + final for final in 'ABCDHF'}
+
+# Mouse button code bits: Shift/Meta/Ctrl held, and pointer motion
+_MOUSE_MODIFIERS = 4 | 8 | 16
+_MOUSE_MOTION = 32
+
+
+class MouseEvent(NamedTuple):
+    """A decoded mouse report (X10 or SGR 1006)"""
+    button: int      # 0-2 left/middle/right, 3 none, 64/65 wheel up/down
+    col: int         # 1-based screen column
+    row: int         # 1-based screen row
+    pressed: bool    # A button is down (False for releases and bare hovering)
+    motion: bool     # The pointer moved (any-motion or drag tracking)
+
+
+def parse_mouse(key: str) -> Optional[MouseEvent]:
+    """Decode a mouse report key, None if key is not one"""
+    if key.startswith('\x1b[<') and key[-1:] in ('M', 'm'):
+        try:
+            code, col, row = (int(part) for part in key[3:-1].split(';'))
+        except ValueError:
+            return None
+        down = key[-1] == 'M'  # SGR reports releases with a lowercase final
+    elif key.startswith('\x1b[M') and len(key) == 6:
+        code, col, row = (ord(char) - 32 for char in key[3:])
+        down = True            # X10 reports releases as button 3
+    else:
+        return None
+    button = code & ~(_MOUSE_MODIFIERS | _MOUSE_MOTION)
+    return MouseEvent(button, col, row, down and button & 3 != 3, bool(code & _MOUSE_MOTION))
+
+
+def coalesce_motion(keys: Sequence[str]) -> List[str]:
+    """Drop pointer motion reports that a later one in the same run supersedes
+
+    A fast sweep across the screen reports every cell the pointer crosses;
+    only the last position before the next other key matters.
+    """
+    result: List[str] = []
+    previous_motion = False
+    for key in keys:
+        event = parse_mouse(key) if key.startswith('\x1b[') else None
+        motion = event is not None and event.motion and not event.pressed
+        if motion and previous_motion:
+            result[-1] = key
+        else:
+            result.append(key)
+        previous_motion = motion
+    return result
+
+
+def _utf8_length(lead: int) -> int:
+    """Length of the UTF-8 sequence starting with lead (1 for invalid leads)"""
+    if lead < 0xC2:
+        return 1
+    if lead < 0xE0:
+        return 2
+    if lead < 0xF0:
+        return 3
+    if lead < 0xF5:
+        return 4
+    return 1
+
+
+class KeyDecoder:
+    """Turns chunks of terminal input bytes into complete keys"""
+
+    def __init__(self, esc_timeout: float = ESC_TIMEOUT):
+        self.esc_timeout = esc_timeout
+        self._buffer = b""     # Bytes of an incomplete key
+        self._paste_scan = 0   # Offset in _buffer already searched for PASTE_END
+
+    @property
+    def pending(self) -> bool:
+        """True while an incomplete key is buffered"""
+        return bool(self._buffer)
+
+    @property
+    def in_paste(self) -> bool:
+        """True while inside a bracketed paste (which is never cut short by flush())"""
+        return self._buffer.startswith(_PASTE_START)
+
+    def feed(self, data: bytes) -> List[str]:
+        """Add input bytes and return the keys they complete"""
+        buffer = self._buffer + data if self._buffer else data
+        keys = []
+        position = 0
+        end = len(buffer)
+        while position < end:
+            key, next_position = self._decode(buffer, position)
+            if key is None:
+                break
+            keys.append(key)
+            position = next_position
+        self._buffer = buffer[position:]
+        return keys
+
+    def flush(self) -> List[str]:
+        """Resolve a buffered partial key once esc_timeout has passed
+
+        A partial escape sequence becomes a lone ESC followed by whatever
+        came after it; a partial UTF-8 character becomes U+FFFD.
+        """
+        keys = []
+        while self._buffer and not self.in_paste:
+            buffer, self._buffer = self._buffer, b""
+            keys.append('\x1b' if buffer[0] == _ESC else '\ufffd')
+            keys.extend(self.feed(buffer[1:]))
+        return keys
+
+    def _decode(self, buffer: bytes, start: int) -> Tuple[Optional[str], int]:
+        """Decode the key at start: (key, end), or (None, start) if incomplete"""
+        lead = buffer[start]
+        if lead != _ESC:
+            return self._char(buffer, start)
+
+        if start + 1 >= len(buffer):
+            return None, start
+        second = buffer[start + 1]
+        if second == 0x5B:  # '['
+            return self._csi(buffer, start)
+        if second == 0x4F:  # 'O'
+            if start + 2 >= len(buffer):
+                return None, start
+            final = buffer[start + 2]
+            if not 0x40 <= final <= 0x7E:
+                return '\x1bO', start + 2  # Alt+O, then whatever follows
+            return _SS3_KEYS.get(final, '\x1bO' + chr(final)), start + 3
+        if second == _ESC:
+            return '\x1b', start + 1  # ESC ESC: the first one stands alone
+
+        # ESC + character: Alt+key
+        key, end = self._char(buffer, start + 1)
+        if key is None:
+            return None, start
+        return '\x1b' + key, end
+
+    @staticmethod
+    def _char(buffer: bytes, start: int) -> Tuple[Optional[str], int]:
+        """Decode one (possibly multi-byte) UTF-8 character"""
+        lead = buffer[start]
+        if lead < 0x80:
+            return chr(lead), start + 1
+        length = _utf8_length(lead)
+        if length == 1:
+            return '\ufffd', start + 1
+        available = min(len(buffer), start + length)
+        for position in range(start + 1, available):
+            if not 0x80 <= buffer[position] <= 0xBF:
+                return '\ufffd', start + 1  # Truncated character
+        if available < start + length:
+            return None, start
+        try:
+            return buffer[start:start + length].decode('utf-8'), start + length
+        except UnicodeDecodeError:
+            return '\ufffd', start + 1
+
+    def _csi(self, buffer: bytes, start: int) -> Tuple[Optional[str], int]:
+        """Decode ESC [ ... (parameters, intermediates, final byte)"""
+        end = len(buffer)
+        position = start + 2
+        if position >= end:
+            return None, start
+
+        if buffer[position] == 0x4D:  # 'M' right away: X10 mouse report
+            if position + 4 > end:
+                return None, start
+            return '\x1b[M' + buffer[position + 1:position + 4].decode('latin-1'), position + 4
+
+        while position < end:
+            byte = buffer[position]
+            if 0x40 <= byte <= 0x7E:  # Final byte
+                sequence = buffer[start:position + 1]
+                if sequence == _PASTE_START:
+                    return self._paste(buffer, start, position + 1)
+                return sequence.decode('ascii'), position + 1
+            if not 0x20 <= byte <= 0x3F or position - start >= MAX_SEQUENCE:
+                # Not a valid sequence: emit what we have and resynchronize
+                return buffer[start:position].decode('latin-1'), position
+            position += 1
+        if end - start > MAX_SEQUENCE:
+            return buffer[start:end].decode('latin-1'), end
+        return None, start
+
+    def _paste(self, buffer: bytes, start: int, body: int) -> Tuple[Optional[str], int]:
+        """Collect a bracketed paste up to PASTE_END as a single key"""
+        scan_from = max(body, start + self._paste_scan)
+        finish = buffer.find(_PASTE_END, scan_from)
+        if finish < 0:
+            # Remember how far we searched so long pastes are not rescanned
+            self._paste_scan = max(body, len(buffer) - len(_PASTE_END) + 1) - start
+            return None, start
+        self._paste_scan = 0
+        text = buffer[body:finish].decode('utf-8', errors='replace')
+        return PASTE_START + text + PASTE_END, finish + len(_PASTE_END)
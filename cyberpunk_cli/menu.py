@@ -6,27 +6,84 @@ Professional terminal menu with retro aesthetics, mouse support,
 and multiple input methods (keyboard, mouse, numbers).
 """
 
-import os
-import sys
 import time
+import asyncio
 import signal
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple, NamedTuple
+import inspect
+import itertools
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, List, Dict, Optional, Sequence, Set, Tuple, NamedTuple, Union
 from dataclasses import dataclass
 
-try:
-    import termios
-    import tty
-    TERMIOS_AVAILABLE = True
-except ImportError:
-    TERMIOS_AVAILABLE = False
-
 from rich.console import Console
-from rich.text import Text
-from rich.panel import Panel
-from rich.align import Align
 
 from .themes import theme_manager
+from .renderer import FrameRenderer
+from .render_cache import render_cache, capture_lines
+from .input_source import InputSource, TerminalInput
+from .search import SearchIndex
+from .navigation import NavigationModel
+from .submenu import SUBMENU_CACHE_SIZE, SubmenuCache, SubmenuSource, populate
+from .keys import PASTE_START, PASTE_END, parse_mouse, coalesce_motion
+from .perf import PerfMonitor, KEY_DECODE, UPDATE, WRITE
+
+
+# Returned by key handlers when the menu should stay open
+_CONTINUE = object()
+
+# Returned instead of _CONTINUE when the key left the screen as it was
+_UNCHANGED = object()
+
+# Returned by a submenu's loop when the user goes back to its parent
+_BACK = object()
+
+
+# Stands in for PerfMonitor.mark when no monitor is attached
+def _skip_mark(phase: str) -> None:
+    pass
+
+
+# Queued by the live refresher to wake run_async() for a repaint
+_REPAINT = object()
+
+
+class _Resized(Exception):
+    """Raised by the SIGWINCH handler to cut a wait for input short"""
+
+
+# Run state a submenu borrows from its parent while open, and hands back
+_SHARED_WITH_SUBMENUS = ("console", "renderer", "input", "perf", "max_fps", "hover",
+                         "execution_delay", "low_bandwidth", "byte_budget", "compact_chrome",
+                         "_chrome_shown", "_pending", "_watching_resize", "_console_size")
+_RETURNED_BY_SUBMENUS = ("perf", "compact_chrome", "_chrome_shown")
+
+# Mouse wheel buttons (MouseEvent.button) and rows scrolled per notch
+MOUSE_WHEEL_UP = 64
+MOUSE_WHEEL_DOWN = 65
+WHEEL_STEP = 3
+
+# Keys used while typing a search query
+SEARCH_KEY = '/'
+BACKSPACE_KEYS = ('\x7f', '\x08')
+
+# Options added to the search index per step while waiting for input
+SEARCH_INDEX_CHUNK = 1000
+
+# Paging keys (value is the direction) and jumps to the first/last option
+PAGE_KEYS = {'\x1b[5~': -1, '\x1b[6~': 1}
+HOME_KEYS = ('\x1b[H', '\x1b[1~', '\x1b[7~')
+END_KEYS = ('\x1b[F', '\x1b[4~', '\x1b[8~')
+
+# Keys that go back to the parent menu from a submenu, and that open a submenu
+BACK_KEYS = ('\x1b', '\x1b[D') + BACKSPACE_KEYS  # ESC, Left arrow, Backspace
+OPEN_KEY = '\x1b[C'  # Right arrow
+
+# Toggles the FPS/latency overlay
+PERF_HUD_KEY = '\x10'  # Ctrl+P
+
+# Default bytes per frame in low-bandwidth mode; bigger frames hold back the next one
+LOW_BANDWIDTH_BUDGET = 1024
 
 
 class MenuOption(NamedTuple):
@@ -36,16 +93,88 @@ class MenuOption(NamedTuple):
     description: str
 
 
+# A live text: a plain string, or a (sync or async) callable returning one
+TextSource = Union[str, Callable[[], Any]]
+
+
+@dataclass
+class LiveBinding:
+    """Sources of an option whose name/description refresh while the menu is open"""
+    key: str
+    name: TextSource
+    description: TextSource
+    interval: float = 1.0       # Seconds between refreshes
+    due: float = 0.0            # monotonic() time of the next refresh
+    position: int = -1          # Last known index in menu.options (a hint)
+
+
 class CyberpunkMenu:
     """Cyberpunk-themed terminal menu with retro aesthetics"""
     
-    def __init__(self, title: str = "Cyberpunk Menu", theme: str = "fallout"):
+    def __init__(self, title: str = "Cyberpunk Menu", theme: str = "fallout",
+                 max_fps: float = 60.0, splash_time: float = 0.5,
+                 execution_delay: float = 0.3,
+                 input_source: Optional[InputSource] = None,
+                 perf: Optional[PerfMonitor] = None, hover: bool = False,
+                 low_bandwidth: bool = False, byte_budget: int = LOW_BANDWIDTH_BUDGET,
+                 submenu_cache_size: int = SUBMENU_CACHE_SIZE):
         self.title = title
         self.options: List[MenuOption] = []
         self.selected_index = 0
+        self.navigation = NavigationModel()  # Selectable positions in self.options
         self.console = Console()
+        self.renderer = FrameRenderer(self.console, low_bandwidth=low_bandwidth)
+        
+        # Slow links: minimal escapes, a byte budget per frame, and the logo
+        # and panels are only ever sent once
+        self.low_bandwidth = low_bandwidth
+        self.byte_budget = byte_budget
+        self.compact_chrome = False   # One-line chrome instead of logo and panels
+        self._chrome_shown = False
+        
+        # Terminal size: measured once per run, then again only after SIGWINCH
+        self._resized = False         # SIGWINCH arrived since the last frame
+        self._wake_on_resize = False  # Blocked waiting for input, interrupt the wait
+        self._watching_resize = False
+        self._previous_winch = None
+        self._console_size = (None, None)  # Console's own width/height, restored when unpinned
+        
+        # Minimum time the loading splash and the execution message stay up
+        self.splash_time = splash_time
+        self.execution_delay = execution_delay
         
-        # Mouse support
+        # Input handling
+        self.hover = hover      # Highlight the row under the mouse pointer
+        self.input = input_source or TerminalInput(motion=hover)  # Keyboard/mouse, or a script
+        self.max_fps = max_fps  # Upper bound on frames per second (0 = unlimited)
+        self.perf = perf        # Per-frame timings, None to skip instrumentation
+        
+        # Viewport (only the visible window of options is rendered)
+        self.scroll_offset = 0
+        self.viewport_rows = 0
+        
+        # Type-to-filter search ("/"), None when not searching
+        self.search_query: Optional[str] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._matches: Sequence[int] = ()
+        self._match_position = 0
+        self._refiltered = False  # Options changed the filtered list since the last frame
+        
+        # Live options (key -> sources), refreshed while the menu waits for input
+        self.live_bindings: Dict[str, LiveBinding] = {}
+        
+        # Submenus (key -> builder), built on first entry and cached for the tree
+        self.submenus: Dict[str, SubmenuSource] = {}
+        self.submenu_cache = SubmenuCache(submenu_cache_size)
+        self.parent: Optional["CyberpunkMenu"] = None  # Menu this one was opened from
+        self._child: Optional["CyberpunkMenu"] = None   # Submenu open on top of this one
+        self._path: Tuple[str, ...] = ()   # Option keys leading here from the root
+        self._frame: Optional[Tuple[Tuple, List[str]]] = None  # Last frame, redrawn on back
+        self._restoring = False            # Next frame may reuse _frame
+        self._pending: Deque[str] = deque()  # Keys read but not applied yet (shared)
+        
+        # Mouse support: screen row (1-based) -> option index, per frame
+        self.row_map: List[Optional[int]] = []
         self.menu_start_line = 0
         self.last_click_time = 0
         self.last_click_index = -1
@@ -56,87 +185,268 @@ class CyberpunkMenu:
     
     def add_option(self, key: str, name: str, description: str) -> "CyberpunkMenu":
         """Add a menu option (fluent interface)"""
-        self.options.append(MenuOption(key, name, description))
+        self._append(MenuOption(key, name, description))
+        return self
+    
+    def add_live_option(self, key: str, name: TextSource, description: TextSource,
+                        interval: float = 1.0) -> "CyberpunkMenu":
+        """Add an option whose name and/or description come from callables
+        
+        Sources are re-evaluated every interval seconds while the menu is
+        open; async callables are awaited. Only rows whose text actually
+        changed and that are on screen trigger a repaint.
+        """
+        binding = LiveBinding(key, name, description, interval, position=len(self.options))
+        self.live_bindings[key] = binding
+        self._append(MenuOption(key, self._initial_text(name), self._initial_text(description)))
+        return self
+    
+    def add_submenu(self, key: str, name: str, description: str,
+                    build: SubmenuSource) -> "CyberpunkMenu":
+        """Add an option that opens a submenu, built by build() on first entry
+        
+        build returns a CyberpunkMenu, or an iterable (a generator is fine)
+        of (key, name, description[, build]) tuples; see cyberpunk_cli.submenu.
+        """
+        self.submenus[key] = build
+        self._append(MenuOption(key, f"{name} ›", description))
         return self
     
-    def add_separator(self) -> "CyberpunkMenu":
-        """Add a visual separator"""
-        self.options.append(MenuOption("separator", "───", ""))
+    def add_separator(self, title: str = "───") -> "CyberpunkMenu":
+        """Add a visual separator, optionally titled"""
+        self._append(MenuOption("separator", title, ""))
         return self
     
     def add_exit(self, name: str = "❌ Exit", description: str = "Quit the application") -> "CyberpunkMenu":
         """Add exit option"""
-        self.options.append(MenuOption("exit", name, description))
+        self._append(MenuOption("exit", name, description))
         return self
     
-    def get_key(self):
-        """Get a single keypress from stdin with mouse support"""
-        if sys.platform == 'win32':
-            try:
-                import msvcrt
-                return msvcrt.getch().decode('utf-8')
-            except ImportError:
-                return input().strip() or '\n'
+    def add_back(self, name: str = "‹ Back", description: str = "Return to the previous menu") -> "CyberpunkMenu":
+        """Add an option that goes back to the parent menu (a no-op at the top level)"""
+        self._append(MenuOption("back", name, description))
+        return self
+    
+    def insert_option(self, position: int, key: str, name: str, description: str) -> "CyberpunkMenu":
+        """Insert a menu option before position (fluent interface)"""
+        position = max(0, min(position, len(self.options)))
+        self._navigation().insert(position, key != "separator")
+        option = MenuOption(key, name, description)
+        self.options.insert(position, option)
+        if self.selected_index >= position and len(self.options) > 1:
+            self.selected_index += 1
+        self._frame = None
+        index = self._search_index
+        if index is not None and position <= index.size:
+            index.insert(position, self._search_text(option))
+        self._refilter()
+        return self
+    
+    def remove_option(self, key: str) -> bool:
+        """Remove the first option with the given key"""
+        for position, option in enumerate(self.options):
+            if option.key == key:
+                break
         else:
-            if not TERMIOS_AVAILABLE:
-                return input().strip() or '\n'
-            
+            return False
+        self._navigation().remove(position)
+        del self.options[position]
+        self.live_bindings.pop(key, None)
+        self.submenus.pop(key, None)
+        self._frame = None
+        if self.selected_index > position:
+            self.selected_index -= 1
+        index = self._search_index
+        if index is not None and position < index.size:
+            index.remove(position)
+        self._refilter()
+        return True
+    
+    def _append(self, option: MenuOption) -> None:
+        self._navigation().append(option.key != "separator")
+        self.options.append(option)
+        self._frame = None
+    
+    @staticmethod
+    def _initial_text(source: TextSource) -> str:
+        """Placeholder shown until a live source is first evaluated"""
+        return source if isinstance(source, str) else "…"
+    
+    def refresh_live_options(self) -> Set[int]:
+        """Re-evaluate due live sources, returning the positions whose text changed
+        
+        Async sources are run to completion on a private event loop; under
+        run_async() they are awaited on the menu's loop instead.
+        """
+        changed = set()
+        for binding in self._due_bindings():
+            values = []
+            for source in (binding.name, binding.description):
+                value = source() if callable(source) else source
+                if inspect.isawaitable(value):
+                    value = asyncio.run(self._await(value))
+                values.append(value)
+            position = self._update_live(binding, *values)
+            if position is not None:
+                changed.add(position)
+        return changed
+    
+    async def refresh_live_options_async(self) -> Set[int]:
+        """Coroutine version of refresh_live_options()"""
+        changed = set()
+        for binding in self._due_bindings():
+            values = []
+            for source in (binding.name, binding.description):
+                value = source() if callable(source) else source
+                if inspect.isawaitable(value):
+                    value = await value
+                values.append(value)
+            position = self._update_live(binding, *values)
+            if position is not None:
+                changed.add(position)
+        return changed
+    
+    @staticmethod
+    async def _await(awaitable):
+        return await awaitable
+    
+    def _due_bindings(self) -> List[LiveBinding]:
+        """Bindings whose refresh time has come, rescheduled for the next one"""
+        now = time.monotonic()
+        due = [binding for binding in self.live_bindings.values() if binding.due <= now]
+        for binding in due:
+            binding.due = now + binding.interval
+        return due
+    
+    def _update_live(self, binding: LiveBinding, name, description) -> Optional[int]:
+        """Store refreshed texts, returning the option's position if they changed"""
+        options = self.options
+        position = binding.position
+        if not (0 <= position < len(options) and options[position].key == binding.key):
+            position = next((i for i, option in enumerate(options) if option.key == binding.key), None)
+            if position is None:
+                return None
+            binding.position = position
+        
+        option = options[position]
+        updated = option._replace(name=str(name), description=str(description))
+        if updated == option:
+            return None
+        options[position] = updated
+        self._frame = None
+        index = self._search_index
+        if index is not None and position < index.size:
+            index.replace(position, self._search_text(updated))
+        self._refilter()
+        return position
+    
+    def _next_refresh(self) -> Optional[float]:
+        """Seconds until the next live source is due, None without live options"""
+        if not self.live_bindings:
+            return None
+        due = min(binding.due for binding in self.live_bindings.values())
+        return max(0.0, due - time.monotonic())
+    
+    def _on_screen(self, positions: Set[int]) -> bool:
+        """Check whether any of the given options is in the last rendered frame"""
+        return any(index in positions for index in self.row_map if index is not None)
+    
+    def _needs_repaint(self, positions: Set[int]) -> bool:
+        """Check whether refreshed options changed the screen: shown rows or the filtered list"""
+        refiltered, self._refiltered = self._refiltered, False
+        return refiltered or self._on_screen(positions)
+    
+    def _wait_for_input(self) -> bool:
+        """Refresh live options until input is pending
+        
+        Returns True when a key is ready, False when an on-screen live row
+        changed or the terminal was resized and the menu needs repainting first.
+        """
+        while True:
+            # Build the search index while idle so the first "/" query doesn't pay for it
+            while not self.input.wait(0) and self._index_search_chunk():
+                pass
+            timeout = self._next_refresh()
+            self._wake_on_resize = True
             try:
-                fd = sys.stdin.fileno()
-                if not os.isatty(fd):
-                    return input().strip() or '\n'
-                
-                # Enable mouse reporting
-                sys.stdout.write('\x1b[?1000h')  # Enable mouse tracking
-                sys.stdout.flush()
-                    
-                old_settings = termios.tcgetattr(fd)
-                try:
-                    tty.setcbreak(fd)
-                    key = sys.stdin.read(1)
-                    if key == '\x1b':  # ESC sequence
-                        # Try to read full escape sequence
-                        try:
-                            next_char = sys.stdin.read(1)
-                            if next_char == '[':
-                                # Could be arrow key or mouse
-                                third_char = sys.stdin.read(1)
-                                if third_char == 'M':
-                                    # Mouse event - read 3 more bytes
-                                    mouse_data = sys.stdin.read(3)
-                                    return '\x1b[M' + mouse_data
-                                else:
-                                    key += next_char + third_char
-                            else:
-                                key += next_char
-                        except:
-                            pass
-                    return key
-                finally:
-                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-                    # Disable mouse reporting
-                    sys.stdout.write('\x1b[?1000l')
-                    sys.stdout.flush()
-            except (termios.error, OSError, AttributeError):
-                # Fallback to regular input for non-TTY environments
-                return input().strip() or '\n'
+                ready = not self._resized and self.input.wait(timeout)
+                self._wake_on_resize = False
+            except _Resized:
+                ready = False
+            finally:
+                self._wake_on_resize = False
+            if ready:
+                return True
+            if self._resized:
+                return False  # The terminal changed size, lay out again
+            if self._needs_repaint(self.refresh_live_options()):
+                return False
+    
+    def _navigation(self) -> NavigationModel:
+        """Navigation model, rebuilt if self.options was modified directly"""
+        if self.navigation.size != len(self.options):
+            self.navigation = NavigationModel(option.key != "separator" for option in self.options)
+        return self.navigation
+    
+    def get_key(self):
+        """Get a single keypress from stdin with mouse support
+        
+        Keys that arrived together (pastes, held keys) are buffered and
+        returned by the following calls before any new input is read.
+        """
+        pending = self._pending
+        if not pending:
+            pending.extend(self.input.read_keys())
+        return pending.popleft()
+    
+    def get_keys(self, deadline: Optional[float] = None) -> List[str]:
+        """Wait for a keypress, then collect every key that arrives before deadline
+        
+        Keys still buffered by get_key() are returned first, without waiting.
+        """
+        pending = self._pending
+        if pending:
+            keys = list(pending)
+            pending.clear()
+            return keys
+        return self.input.read_keys(deadline)
     
     def handle_mouse_event(self, mouse_data: str) -> Optional[str]:
-        """Handle mouse click events"""
-        if len(mouse_data) < 6 or not mouse_data.startswith('\x1b[M'):
+        """Handle mouse clicks, the wheel and pointer motion (hover)
+        
+        Returns '\\n' for a double-click, 'click', 'scroll' or 'hover' when
+        the event changed the menu, otherwise None.
+        """
+        event = parse_mouse(mouse_data)
+        if event is None:
             return None
-            
-        # Parse mouse event
-        button = ord(mouse_data[3]) - 32
-        col = ord(mouse_data[4]) - 32
-        row = ord(mouse_data[5]) - 32
-        
-        # Check if click is on a menu item
-        menu_row = row - self.menu_start_line
-        if 0 <= menu_row < len(self.options):
+        
+        # Mouse wheel scrolls the viewport
+        if event.button in (MOUSE_WHEEL_UP, MOUSE_WHEEL_DOWN):
+            step = -WHEEL_STEP if event.button == MOUSE_WHEEL_UP else WHEEL_STEP
+            self.scroll(step)
+            return 'scroll'
+        
+        # Button releases don't act on rows
+        if not event.pressed and not event.motion:
+            return None
+        
+        # Check if the pointer is on a menu item, using the rows of the last frame;
+        # keys applied since then may have filtered or moved the options
+        row = event.row
+        menu_row = self.row_map[row - 1] if 0 < row <= len(self.row_map) else None
+        position = None if menu_row is None else self._display_position(menu_row)
+        if position is not None:
             # Skip separators
-            if self.options[menu_row].key == "separator":
+            if not self._navigation().is_selectable(menu_row):
                 return None
+            
+            # Hovering (or dragging) highlights the row under the pointer
+            if event.motion:
+                if position == self._cursor():
+                    return None
+                self._move_to(position)
+                return 'hover'
                 
             # Calculate double-click
             current_time = time.time()
@@ -149,7 +459,7 @@ class CyberpunkMenu:
             self.last_click_index = menu_row
             
             # Update selection
-            self.selected_index = menu_row
+            self._move_to(position)
             
             if is_double_click:
                 return '\n'  # Double-click executes
@@ -158,120 +468,786 @@ class CyberpunkMenu:
         
         return None
     
+    def _filtering(self) -> bool:
+        """True while a non-empty search query narrows the options"""
+        return bool(self.search_query)
+    
+    def _display_rows(self) -> Sequence[int]:
+        """Option indices in display order (search matches while filtering)"""
+        if self._filtering():
+            return self._matches
+        return range(len(self.options))
+    
+    def _display_position(self, index: int) -> Optional[int]:
+        """Display position of an option, None if it is not listed any more"""
+        if not 0 <= index < len(self.options):
+            return None
+        if not self._filtering():
+            return index
+        matches = self._matches
+        # Look where the viewport is first, then through the rest
+        first = min(self.scroll_offset, len(matches))
+        window = range(first, min(len(matches), first + self.viewport_rows))
+        for position in itertools.chain(window, range(first), range(window.stop, len(matches))):
+            if matches[position] == index:
+                return position
+        return None
+    
+    def _cursor(self) -> int:
+        """Display position of the selected option"""
+        return self._match_position if self._filtering() else self.selected_index
+    
+    def _move_to(self, position: int) -> None:
+        """Select the option shown at a display position"""
+        if self._filtering():
+            self._match_position = position
+            self.selected_index = self._matches[position]
+        else:
+            self.selected_index = position
+    
+    def _step(self, delta: int, wrap: bool = True) -> None:
+        """Move the selection delta selectable rows (negative is up)
+        
+        Arrow keys wrap around the ends of the menu, page keys stop there.
+        """
+        if self._filtering():
+            count = len(self._matches)
+            if count:
+                target = self._match_position + delta
+                self._move_to(target % count if wrap else min(max(target, 0), count - 1))
+            return
+        self.selected_index = self._navigation().step(self.selected_index, delta, wrap)
+    
+    def _jump(self, end: bool) -> None:
+        """Select the first (end=False) or last (end=True) selectable row"""
+        if self._filtering():
+            if self._matches:
+                self._move_to(len(self._matches) - 1 if end else 0)
+            return
+        navigation = self._navigation()
+        target = navigation.last() if end else navigation.first()
+        if target is not None:
+            self.selected_index = target
+    
+    def scroll(self, rows: int) -> None:
+        """Scroll the viewport, keeping the selection inside the visible window"""
+        display = self._display_rows()
+        max_offset = max(0, len(display) - max(1, self.viewport_rows))
+        self.scroll_offset = min(max(0, self.scroll_offset + rows), max_offset)
+        
+        first = self.scroll_offset
+        last = min(len(display), first + max(1, self.viewport_rows)) - 1
+        cursor = self._cursor()
+        if first <= cursor <= last or last < first:
+            return
+        if self._filtering():
+            self._move_to(first if cursor < first else last)
+            return
+        
+        navigation = self._navigation()
+        if cursor < first:
+            target = navigation.at_or_after(first)
+        else:
+            target = navigation.at_or_before(last)
+        if target is not None and first <= target <= last:
+            self.selected_index = target
+    
+    def _ensure_visible(self) -> None:
+        """Move the viewport so the selected option is on screen"""
+        rows = max(1, self.viewport_rows)
+        cursor = self._cursor()
+        if cursor < self.scroll_offset:
+            self.scroll_offset = cursor
+        elif cursor >= self.scroll_offset + rows:
+            self.scroll_offset = cursor - rows + 1
+        self.scroll_offset = max(0, min(self.scroll_offset, len(self._display_rows()) - rows))
+    
     def render_menu(self) -> None:
         """Render the menu using current theme"""
         theme = theme_manager.get_theme()
         if not theme:
             self.console.print("[red]Error: No theme available[/red]")
             return
-            
-        self.console.clear()
         
-        # Get terminal width for responsive layout
-        terminal_width = self.console.size.width
+        perf = self.perf
+        mark = perf.mark if perf else _skip_mark
+        if perf:
+            perf.lap()
+        if self._resized:
+            self._relayout()
         
-        # Render theme-specific elements
-        theme.render_logo(self.console)
-        theme.render_subtitle(self.console)
+        # On a slow link the logo is sent with the first paint only; a later
+        # repaint from scratch (resize, theme change, next run) goes compact
+        if self.low_bandwidth and self._chrome_shown and not self.compact_chrome:
+            size = (self.console.size.width, self.console.size.height)
+            self.compact_chrome = self.renderer.needs_full_repaint(theme.name, size)
         
-        # Track menu start position for mouse clicks
-        if terminal_width >= 80:
-            self.menu_start_line = 18  # Full logo + subtitle + spacing
+        # Back from a submenu with nothing changed here: redraw the last frame
+        # (keys applied since the return may have moved, scrolled or searched)
+        if self._restoring and self._frame is not None and self._frame[0] == self._frame_key(theme):
+            lines = self._frame[1]
         else:
-            self.menu_start_line = 8   # Compact logo + subtitle + spacing
+            lines = self._compose_frame(theme, mark)
+            self._frame = (self._frame_key(theme), lines)
+        self._restoring = False
         
-        # Render menu items
-        for i, option in enumerate(self.options):
-            if option.key == "separator":
-                separator = theme.render_separator(option.name)
-                self.console.print(separator)
+        # Only the lines that changed since the last frame reach the terminal
+        overlay = perf.hud_text() if perf and perf.hud else None
+        written = self.renderer.draw(lines, theme.name, overlay)
+        self._chrome_shown = True
+        if perf:
+            perf.mark(WRITE)
+            perf.end_frame(written)
+    
+    def _watch_resize(self, loop: Optional[asyncio.AbstractEventLoop] = None,
+                      wake: Optional[Callable[[], None]] = None) -> None:
+        """Pin the console size for the run and re-measure it only after SIGWINCH
+        
+        Without a handler (no SIGWINCH, not on the main thread, not a
+        terminal) the size is left unpinned and Rich probes it every frame.
+        A console created with a fixed width and height (or COLUMNS and
+        LINES) never follows the terminal, so it is left alone.
+        """
+        if self._watching_resize or not hasattr(signal, "SIGWINCH") or not self.console.is_terminal:
+            return
+        console_size = (self.console._width, self.console._height)
+        if None not in console_size:
+            return
+        try:
+            if loop is not None:
+                previous = signal.getsignal(signal.SIGWINCH)
+                loop.add_signal_handler(signal.SIGWINCH, self._on_resize_async, wake)
+                self._previous_winch = previous
             else:
-                is_selected = (i == self.selected_index)
-                menu_line = theme.render_menu_item(option.name, option.description, is_selected)
-                self.console.print(menu_line)
+                self._previous_winch = signal.signal(signal.SIGWINCH, self._on_resize)
+        except (ValueError, OSError, RuntimeError, NotImplementedError):
+            return
+        self._watching_resize = True
+        self._resized = False
+        self._console_size = console_size
+        self.console.size = self.console.size
+    
+    def _unwatch_resize(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Put the previous SIGWINCH handler and the console's own size back"""
+        if not self._watching_resize:
+            return
+        self._watching_resize = False
+        try:
+            if loop is not None:
+                loop.remove_signal_handler(signal.SIGWINCH)  # Leaves SIG_DFL behind
+            if self._previous_winch is not None:
+                signal.signal(signal.SIGWINCH, self._previous_winch)
+        except (ValueError, OSError, RuntimeError, TypeError):
+            pass
+        self._previous_winch = None
+        self.console.size = self._console_size
+    
+    def _on_resize(self, signum, frame) -> None:
+        """SIGWINCH handler: relayout before the next frame"""
+        menu = self._innermost()
+        menu._resized = True
+        if callable(self._previous_winch):
+            self._previous_winch(signum, frame)
+        if menu._wake_on_resize:
+            menu._wake_on_resize = False
+            raise _Resized
+    
+    def _on_resize_async(self, wake: Optional[Callable[[], None]]) -> None:
+        """SIGWINCH callback on the event loop"""
+        self._innermost()._resized = True
+        if callable(self._previous_winch):
+            self._previous_winch(signal.SIGWINCH, None)
+        if wake is not None:
+            wake()
+    
+    def _relayout(self) -> None:
+        """Re-measure the terminal; the renderer repaints fully if the size changed"""
+        self._resized = False
+        if self._watching_resize:
+            self.console.size = self._console_size
+            self.console.size = self.console.size
+    
+    def _frame_key(self, theme) -> Tuple:
+        """Everything besides the options that a composed frame depends on"""
+        return (theme.name, tuple(self.console.size), self.compact_chrome,
+                self.selected_index, self.scroll_offset, self.search_query, self._match_position)
+    
+    def _compose_frame(self, theme, mark: Callable[[str], None]) -> List[str]:
+        """Build the frame as ANSI lines, laying out the viewport and row_map"""
+        terminal_height = self.console.size.height
+        
+        # Render theme-specific elements (cached as pre-encoded ANSI), in the
+        # variant that fits the terminal unless a slow link forces one-liners
+        tier = "line" if self.compact_chrome else None
+        lines: List[str] = []
+        lines.extend(render_cache.chrome(theme, "logo", self.console, tier))
+        mark("render_logo")
+        lines.extend(render_cache.chrome(theme, "subtitle", self.console, tier))
+        mark("render_subtitle")
+        footer = render_cache.chrome(theme, "footer", self.console, tier)
+        mark("render_footer")
+        
+        if self.parent is not None:
+            breadcrumb = theme.render_breadcrumb(self.breadcrumb())
+            lines.extend(capture_lines(self.console, lambda c: c.print(
+                breadcrumb, no_wrap=True, overflow="ellipsis")))
+            mark("render_breadcrumb")
+        
+        # Fit the options between header and footer, leaving the last row for
+        # the cursor; scrolling menus and searches each take one more row
+        display = self._display_rows()
+        total = len(display)
+        available = terminal_height - len(lines) - len(footer) - 1
+        if self.search_query is not None:
+            available -= 1
+        scrolling = total > available
+        self.viewport_rows = max(1, available - 1 if scrolling else available)
+        self._ensure_visible()
+        
+        # Render only the visible menu items, recording where each one lands
+        first = self.scroll_offset
+        last = min(total, first + self.viewport_rows)
+        self.menu_start_line = len(lines) + 1
+        row_map: List[Optional[int]] = [None] * len(lines)
+        for i in display[first:last]:
+            is_selected = (i == self.selected_index)
+            lines.extend(render_cache.row(theme, self.options[i], is_selected, self.console))
+            row_map.append(i)
+        self.row_map = row_map
+        mark("render_menu_item")
+        
+        if scrolling:
+            indicator = theme.render_scroll_indicator(first, last, total)
+            lines.extend(capture_lines(self.console, lambda c: c.print(indicator, no_wrap=True)))
+            mark("render_scroll_indicator")
+        
+        if self.search_query is not None:
+            prompt = theme.render_search_prompt(self.search_query, total)
+            lines.extend(capture_lines(self.console, lambda c: c.print(prompt, no_wrap=True)))
+            mark("render_search_prompt")
         
         # Render footer
-        theme.render_footer(self.console)
+        lines.extend(footer)
+        return lines
+    
+    def run(self, warmup: Optional[Callable[[], Any]] = None) -> Optional[str]:
+        """Run the interactive menu and return selected option key
+        
+        warmup, if given, runs in a background thread while the loading
+        splash is shown; the menu opens once it has finished and the splash
+        has been up for splash_time, whichever comes later.
+        """
+        theme = theme_manager.get_theme()
+        if not theme:
+            self.console.print("[red]Error: No theme available[/red]")
+            return None
+        
+        try:
+            with self.input:
+                self._watch_resize()
+                return self._run(theme, warmup)
+        finally:
+            self._unwatch_resize()
+            if self.perf:
+                self.perf.write_prometheus()
     
-    def run(self) -> Optional[str]:
-        """Run the interactive menu and return selected option key"""
+    async def run_async(self, warmup: Optional[Callable[[], Any]] = None) -> Optional[str]:
+        """Run the menu as a coroutine on the running event loop
+        
+        Stdin is watched with loop.add_reader(), so other tasks keep running
+        while the menu is open. warmup runs in the loop's default executor.
+        Input sources without a file descriptor (no terminal, scripted input)
+        run the blocking menu loop in a worker thread instead.
+        """
         theme = theme_manager.get_theme()
         if not theme:
             self.console.print("[red]Error: No theme available[/red]")
             return None
+        
+        loop = asyncio.get_running_loop()
+        with self.input:
+            fd = self.input.fileno()
+            if fd is None:
+                return await loop.run_in_executor(None, self._run, theme, warmup)
+            
+            await self._splash_async(theme, warmup)
+            self._start_loop()
+            await self.refresh_live_options_async()
+            
+            keys: asyncio.Queue = asyncio.Queue()
+            
+            flush_timer = [None]  # Resolves a lone ESC if nothing follows it
+            
+            def queue(complete):
+                for key in complete:
+                    keys.put_nowait(key)
+            
+            def on_readable():
+                if flush_timer[0] is not None:
+                    flush_timer[0].cancel()
+                    flush_timer[0] = None
+                try:
+                    queue(self.input.read_available())
+                except EOFError:
+                    keys.put_nowait(None)
+                    return
+                timeout = self.input.pending_timeout()
+                if timeout is not None:
+                    flush_timer[0] = loop.call_later(timeout, lambda: queue(self.input.flush()))
+            
+            loop.add_reader(fd, on_readable)
+            self._watch_resize(loop, lambda: keys.put_nowait(_REPAINT))
+            refresher = loop.create_task(self._refresh_live_loop(keys))
+            try:
+                return await self._loop_async(theme, keys)
+            except KeyboardInterrupt:
+                self.console.print(theme.get_goodbye_message())
+                return None
+            finally:
+                refresher.cancel()
+                loop.remove_reader(fd)
+                self._unwatch_resize(loop)
+                if self.perf:
+                    self.perf.write_prometheus()
+    
+    async def _refresh_live_loop(self, keys: "asyncio.Queue") -> None:
+        """Refresh live options on schedule, waking the menu loop for visible changes"""
+        while True:
+            timeout = self._next_refresh()
+            if timeout is None:
+                return
+            await asyncio.sleep(timeout)
+            if self._needs_repaint(await self.refresh_live_options_async()):
+                keys.put_nowait(_REPAINT)
+    
+    async def _loop_async(self, theme, keys: "asyncio.Queue") -> Optional[str]:
+        """Menu loop fed by the stdin reader callback"""
+        repaint = True
+        while True:
+            if repaint:
+                self.render_menu()
+            repaint = False
+            
+            deadline = time.monotonic() + self._frame_interval()
             
+            while keys.empty() and self._index_search_chunk():
+                await asyncio.sleep(0)  # Index while idle, letting keys in between steps
+            key = await keys.get()
+            if self.perf:
+                self.perf.key_ready()
+            while True:
+                if key is None:
+                    self.console.print(theme.get_goodbye_message())
+                    return None
+                result = _CONTINUE if key is _REPAINT else self._apply_key(key, theme)
+                if isinstance(result, CyberpunkMenu):
+                    result = await self._descend_async(result, theme, keys)
+                    if result is not _CONTINUE:
+                        return result  # Finished inside the submenu
+                if result is not _UNCHANGED:
+                    repaint = True
+                if result is not _CONTINUE and result is not _UNCHANGED:
+                    if result is not None and result is not _BACK and self.execution_delay > 0:
+                        await asyncio.sleep(self.execution_delay)
+                    return result
+                
+                # Coalesce keys arriving before the next frame is due
+                if not keys.empty():
+                    key = keys.get_nowait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    key = await asyncio.wait_for(keys.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if self.perf:
+                self.perf.mark(UPDATE)
+    
+    async def _splash_async(self, theme, warmup: Optional[Callable[[], Any]]) -> None:
+        """Coroutine version of _splash; warmup runs in the default executor"""
+        if warmup is None and self.splash_time <= 0:
+            return
+        
+        shown_until = time.monotonic() + self.splash_time
         self.console.print(theme.get_loading_message())
-        time.sleep(0.5)  # Brief loading effect
+        warming = None
+        if warmup is not None:
+            warming = asyncio.get_running_loop().run_in_executor(None, warmup)
+        self._prepare(theme)
+        while (((warming is not None and not warming.done()) or time.monotonic() < shown_until)
+               and self._index_search_chunk()):
+            await asyncio.sleep(0)  # Lets the warm-up's completion in between steps
+        if warming is not None:
+            await warming
         
+        remaining = shown_until - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+    
+    def _run(self, theme, warmup: Optional[Callable[[], Any]] = None) -> Optional[str]:
+        """Menu loop, called with the terminal session active"""
+        self._splash(theme, warmup)
+        self._start_loop()
+        self.refresh_live_options()
+        return self._loop(theme)
+    
+    def _loop(self, theme):
+        """Render and apply keys until this menu (or a submenu of it) finishes"""
+        pending = self._pending  # Shared with submenus, which take over the keys after them
+        repaint = True
         while True:
-            self.render_menu()
+            if repaint:
+                self.render_menu()
+            
+            # Never render faster than max_fps; keys arriving meanwhile are coalesced
+            deadline = time.monotonic() + self._frame_interval()
             
             try:
-                key = self.get_key()
-                
-                # Handle mouse events
-                if isinstance(key, str) and key.startswith('\x1b[M'):
-                    mouse_result = self.handle_mouse_event(key)
-                    if mouse_result == '\n':  # Double-click
-                        option = self.options[self.selected_index]
-                        if option.key == "exit":
-                            self.console.print(theme.get_goodbye_message())
-                            return None
-                        else:
-                            self.console.clear()
-                            self.console.print(theme.get_execution_message(option.name))
-                            time.sleep(0.3)
-                            return option.key
-                    elif mouse_result == 'click':
-                        # Single click just updates selection, re-render
+                repaint = True
+                if not pending:
+                    if not self._wait_for_input():
+                        continue  # A visible live row changed, repaint it
+                    perf = self.perf
+                    if perf:
+                        perf.key_ready()
+                    pending.extend(coalesce_motion(self.get_keys(deadline)))
+                    if perf:
+                        perf.mark(KEY_DECODE)
+                repaint = False
+                while pending:
+                    result = self._apply_key(pending.popleft(), theme)
+                    if isinstance(result, CyberpunkMenu):
+                        result = self._descend(result, theme)
+                        if result is not _CONTINUE:
+                            return result  # Finished inside the submenu
+                    if result is _UNCHANGED:
                         continue
-                
-                # Arrow key navigation
-                elif key == '\x1b[A':  # Up arrow
-                    self.selected_index = (self.selected_index - 1) % len(self.options)
-                    # Skip separators
-                    while self.options[self.selected_index].key == "separator":
-                        self.selected_index = (self.selected_index - 1) % len(self.options)
-                        
-                elif key == '\x1b[B':  # Down arrow
-                    self.selected_index = (self.selected_index + 1) % len(self.options)
-                    # Skip separators
-                    while self.options[self.selected_index].key == "separator":
-                        self.selected_index = (self.selected_index + 1) % len(self.options)
-                        
-                elif key in ['\r', '\n']:  # Enter
-                    option = self.options[self.selected_index]
-                    if option.key == "exit":
-                        self.console.print(theme.get_goodbye_message())
-                        return None
-                    elif option.key == "separator":
-                        continue  # Can't select separators
-                    else:
-                        self.console.clear()
-                        self.console.print(theme.get_execution_message(option.name))
-                        time.sleep(0.3)
-                        return option.key
-                        
-                elif key in ['\x1b', 'q', 'Q']:  # ESC or Q
-                    self.console.print(theme.get_goodbye_message())
-                    return None
-                    
-                elif key.isdigit():  # Number key shortcuts
-                    num = int(key)
-                    if 0 <= num < len(self.options):
-                        option = self.options[num]
-                        if option.key == "separator":
-                            continue
-                        self.selected_index = num
-                        if option.key == "exit":
-                            self.console.print(theme.get_goodbye_message())
-                            return None
-                        else:
-                            self.console.clear()
-                            self.console.print(theme.get_execution_message(option.name))
-                            time.sleep(0.3)
-                            return option.key
-                        
+                    repaint = True
+                    if result is not _CONTINUE:
+                        if result is not None and result is not _BACK and self.execution_delay > 0:
+                            time.sleep(self.execution_delay)
+                        return result
+                if self.perf:
+                    self.perf.mark(UPDATE)
             except (KeyboardInterrupt, EOFError):
                 self.console.print(theme.get_goodbye_message())
-                return None
\ No newline at end of file
+                return None
+    
+    def _frame_interval(self) -> float:
+        """Minimum time before the next frame
+        
+        In low-bandwidth mode a frame over byte_budget holds the next one back
+        in proportion, so keys pile up and are applied together instead of
+        each costing another large frame.
+        """
+        interval = 1.0 / self.max_fps if self.max_fps else 0.0
+        if self.low_bandwidth and self.byte_budget > 0:
+            interval *= max(1.0, self.renderer.bytes_written / self.byte_budget)
+        return interval
+    
+    def _start_loop(self) -> None:
+        """Reset per-run state before the first frame"""
+        self.renderer.invalidate()  # Screen contents are unknown, repaint fully
+        self._pending.clear()
+        self._settle_selection()
+    
+    def _settle_selection(self) -> None:
+        """Never start on a separator"""
+        navigation = self._navigation()
+        if not navigation.is_selectable(self.selected_index):
+            start = navigation.at_or_after(self.selected_index)
+            self.selected_index = start if start is not None else (navigation.first() or 0)
+    
+    def _splash(self, theme, warmup: Optional[Callable[[], Any]]) -> None:
+        """Show the loading message while warmup runs, for at least splash_time
+        
+        The menu prepares its first frame meanwhile and indexes options for
+        search until the splash may end; waiting for input indexes the rest.
+        """
+        if warmup is None and self.splash_time <= 0:
+            return
+        
+        shown_until = time.monotonic() + self.splash_time
+        self.console.print(theme.get_loading_message())
+        
+        failure: List[BaseException] = []
+        thread = None
+        if warmup is not None:
+            def run_warmup():
+                try:
+                    warmup()
+                except BaseException as error:
+                    failure.append(error)
+            
+            thread = threading.Thread(target=run_warmup, name="cyberpunk-warmup", daemon=True)
+            thread.start()
+        self._prepare(theme)
+        while (((thread is not None and thread.is_alive()) or time.monotonic() < shown_until)
+               and self._index_search_chunk()):
+            pass
+        if thread is not None:
+            thread.join()
+            if failure:
+                raise failure[0]  # Surface warm-up errors in the caller's thread
+        
+        remaining = shown_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def _prepare(self, theme) -> None:
+        """Do the first frame's slow work ahead of it: theme styles and chrome"""
+        theme.styles
+        tier = "line" if self.compact_chrome else None
+        for part in render_cache.CHROME_PARTS:
+            render_cache.chrome(theme, part, self.console, tier)
+    
+    def toggle_hud(self) -> None:
+        """Show or hide the FPS/latency overlay, starting a monitor if needed"""
+        if self.perf is None:
+            self.perf = PerfMonitor()
+            self.perf.hud = True
+        else:
+            self.perf.hud = not self.perf.hud
+    
+    def _apply_key(self, key: str, theme):
+        """Apply one key to the menu state
+        
+        Returns _CONTINUE to keep the menu open (_UNCHANGED if nothing needs
+        repainting), a CyberpunkMenu to open as a submenu, _BACK to return to
+        the parent menu, otherwise the value run() returns.
+        """
+        if key == PERF_HUD_KEY:
+            self.toggle_hud()
+            return _CONTINUE
+        
+        is_mouse = key.startswith('\x1b[M') or key.startswith('\x1b[<')
+        if self.search_query is not None and not is_mouse:
+            return self._apply_search_key(key, theme)
+        
+        # Handle mouse events
+        if is_mouse:
+            mouse_result = self.handle_mouse_event(key)
+            if mouse_result == '\n':  # Double-click
+                return self._select(self.options[self.selected_index], theme)
+            if mouse_result is None:
+                return _UNCHANGED  # Release, or the pointer stayed on the same row
+            # Single click just updates selection
+        
+        # Arrow key navigation
+        elif key == '\x1b[A':  # Up arrow
+            self._step(-1)
+                
+        elif key == '\x1b[B':  # Down arrow
+            self._step(1)
+            
+        elif key in PAGE_KEYS:  # Page up/down
+            self._step(self._page_size() * PAGE_KEYS[key], wrap=False)
+            
+        elif key in HOME_KEYS or key in END_KEYS:
+            self._jump(end=key in END_KEYS)
+                
+        elif key in ['\r', '\n']:  # Enter
+            if self._navigation().is_selectable(self.selected_index):  # Can't select separators
+                return self._select(self.options[self.selected_index], theme)
+                
+        elif key == SEARCH_KEY:  # Start type-to-filter search
+            self.search_query = ""
+            
+        elif self.parent is not None and key in BACK_KEYS:  # Back to the parent menu
+            return _BACK
+            
+        elif key == OPEN_KEY:  # Right arrow opens a submenu
+            if (self._navigation().is_selectable(self.selected_index) and
+                    self.options[self.selected_index].key in self.submenus):
+                return self._select(self.options[self.selected_index], theme)
+            
+        elif key in ['\x1b', 'q', 'Q']:  # ESC or Q
+            self.console.print(theme.get_goodbye_message())
+            return None
+            
+        elif key.isdigit():  # Number key shortcuts
+            num = int(key)
+            if self._navigation().is_selectable(num):
+                self.selected_index = num
+                return self._select(self.options[num], theme)
+        
+        return _CONTINUE
+    
+    def _page_size(self) -> int:
+        """Rows moved by page up/down"""
+        return max(1, self.viewport_rows - 1)
+    
+    def _apply_search_key(self, key: str, theme):
+        """Apply one key while the search prompt is open"""
+        if key == '\x1b':  # ESC leaves search, keeping the selection
+            self.search_query = None
+            
+        elif key in ['\r', '\n']:
+            if self._filtering() and not self._matches:
+                return _CONTINUE
+            if self._navigation().is_selectable(self.selected_index):
+                return self._select(self.options[self.selected_index], theme)
+            
+        elif key in ('\x1b[A', '\x1b[B'):
+            self._step(-1 if key == '\x1b[A' else 1)
+            
+        elif key in PAGE_KEYS:
+            self._step(self._page_size() * PAGE_KEYS[key], wrap=False)
+            
+        elif key in BACKSPACE_KEYS:
+            self._update_search(self.search_query[:-1])
+            
+        elif len(key) == 1 and key.isprintable():
+            self._update_search(self.search_query + key)
+            
+        elif key.startswith(PASTE_START):
+            text = key[len(PASTE_START):-len(PASTE_END)]
+            text = ''.join(char for char in text if char.isprintable())
+            if text:
+                self._update_search(self.search_query + text)
+        
+        return _CONTINUE
+    
+    def _update_search(self, query: str) -> None:
+        """Filter options by query, refining the previous result where possible"""
+        self.search_query = query
+        if not query:
+            return
+        
+        self._matches = self._search_results(query)
+        self.scroll_offset = 0
+        if self._matches:
+            self._move_to(0)
+        else:
+            self._match_position = 0
+    
+    def _refilter(self) -> None:
+        """Re-run an active search after the options it filters changed"""
+        if not self._filtering():
+            return
+        selected, previous = self.selected_index, self._match_position
+        self._matches = self._search_results(self.search_query)
+        self._refiltered = True  # The filtered list may have changed under the last frame
+        position = self._display_position(selected)
+        if position is not None:
+            self._match_position = position  # Keep the selection where it still matches
+        elif self._matches:
+            self._move_to(min(previous, len(self._matches) - 1))
+        else:
+            self._match_position = 0
+    
+    def _search_results(self, query: str) -> Sequence[int]:
+        """Options matching query, indexing options not indexed yet"""
+        while self._index_search_chunk():
+            pass
+        return self._search_index.search(query)
+    
+    def _index_search_chunk(self) -> bool:
+        """Index the next SEARCH_INDEX_CHUNK options, False once all are indexed"""
+        index = self._search_index
+        if index is None:
+            index = self._search_index = SearchIndex()
+        size = index.size
+        if size >= len(self.options):
+            return False
+        index.extend(self._search_text(option)
+                     for option in self.options[size:size + SEARCH_INDEX_CHUNK])
+        return True
+    
+    @staticmethod
+    def _search_text(option: MenuOption) -> str:
+        """Text an option is found by (separators match nothing)"""
+        return "" if option.key == "separator" else f"{option.name} {option.description}"
+    
+    def _select(self, option: MenuOption, theme):
+        """Finish the menu with the given option, or open its submenu"""
+        if option.key in self.submenus:
+            return self.submenu(option.key)
+        if option.key == "back":
+            return _CONTINUE if self.parent is None else _BACK
+        if option.key == "exit":
+            self.console.print(theme.get_goodbye_message())
+            return None
+        self.console.clear()
+        self.console.print(theme.get_execution_message(option.name))
+        return option.key  # The run loop pauses execution_delay before returning
+    
+    def submenu(self, key: str) -> "CyberpunkMenu":
+        """The submenu behind an option, built on first use and cached for the tree"""
+        return self.submenu_cache.get(self._path + (key,), lambda: self._build_submenu(key))
+    
+    def _build_submenu(self, key: str) -> "CyberpunkMenu":
+        """Run an option's builder, turning an iterable of options into a menu"""
+        theme = theme_manager.get_theme()
+        built = self.submenus[key]()
+        if isinstance(built, CyberpunkMenu):
+            child = built
+        else:
+            title = next((option.name.rstrip(" ›") for option in self.options
+                          if option.key == key), key)
+            child = CyberpunkMenu(title, theme.name if theme else "fallout")
+            populate(child, built)
+        if theme is not None and theme_manager.get_theme() is not theme:
+            theme_manager.set_theme(theme.name)  # Creating a menu switched the global theme
+        child.submenu_cache = self.submenu_cache
+        child._path = self._path + (key,)
+        return child
+    
+    def breadcrumb(self) -> List[str]:
+        """Titles of the open menus, from the top level down to this one"""
+        titles = []
+        menu: Optional[CyberpunkMenu] = self
+        while menu is not None:
+            titles.append(menu.title)
+            menu = menu.parent
+        return titles[::-1]
+    
+    def _descend(self, child: "CyberpunkMenu", theme):
+        """Run a submenu in place of this menu until it finishes or goes back"""
+        self._open_child(child)
+        try:
+            child.refresh_live_options()
+            result = child._loop(theme)
+        finally:
+            self._close_child(child)
+        return _CONTINUE if result is _BACK else result
+    
+    async def _descend_async(self, child: "CyberpunkMenu", theme, keys: "asyncio.Queue"):
+        """Coroutine version of _descend, feeding the submenu from the same key queue"""
+        self._open_child(child)
+        refresher = None
+        try:
+            await child.refresh_live_options_async()
+            refresher = asyncio.get_running_loop().create_task(child._refresh_live_loop(keys))
+            result = await child._loop_async(theme, keys)
+        finally:
+            if refresher is not None:
+                refresher.cancel()
+            self._close_child(child)
+        return _CONTINUE if result is _BACK else result
+    
+    def _open_child(self, child: "CyberpunkMenu") -> None:
+        """Hand the terminal, renderer and input over to a submenu"""
+        child.parent = self
+        for name in _SHARED_WITH_SUBMENUS:
+            setattr(child, name, getattr(self, name))
+        child._resized = False
+        child._settle_selection()
+        self._child = child
+    
+    def _close_child(self, child: "CyberpunkMenu") -> None:
+        """Take over again from a submenu; the next frame redraws the last one"""
+        self._child = None
+        for name in _RETURNED_BY_SUBMENUS:
+            setattr(self, name, getattr(child, name))
+        self._resized = self._resized or child._resized
+        self._restoring = True
+    
+    def _innermost(self) -> "CyberpunkMenu":
+        """The submenu currently shown (this menu when none is open)"""
+        menu = self
+        while menu._child is not None:
+            menu = menu._child
+        return menu
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Navigation Model - Selectable positions for fast menu movement
+
+Separators cannot be selected, so moving the selection used to mean
+stepping through options one at a time until a selectable one turned up
+(forever, for a menu of nothing but separators). The model keeps the
+sorted positions of selectable options instead; an option's rank among
+them comes from a binary search, and every move is rank arithmetic.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional
+
+
+class NavigationModel:
+    """Sorted selectable positions with O(log n) moves"""
+
+    def __init__(self, selectable: Iterable[bool] = ()):
+        self.size = 0                    # Number of options (selectable or not)
+        self.positions: List[int] = []   # Indices of selectable options, ascending
+        for flag in selectable:
+            self.append(flag)
+
+    def __len__(self) -> int:
+        """Number of selectable options"""
+        return len(self.positions)
+
+    def append(self, selectable: bool) -> None:
+        """Track an option added at the end"""
+        if selectable:
+            self.positions.append(self.size)
+        self.size += 1
+
+    def insert(self, index: int, selectable: bool) -> None:
+        """Track an option inserted before index"""
+        positions = self.positions
+        rank = bisect_left(positions, index)
+        positions[rank:] = [position + 1 for position in positions[rank:]]
+        if selectable:
+            positions.insert(rank, index)
+        self.size += 1
+
+    def remove(self, index: int) -> None:
+        """Track the removal of the option at index"""
+        positions = self.positions
+        rank = bisect_left(positions, index)
+        if rank < len(positions) and positions[rank] == index:
+            del positions[rank]
+        positions[rank:] = [position - 1 for position in positions[rank:]]
+        self.size -= 1
+
+    def is_selectable(self, index: int) -> bool:
+        positions = self.positions
+        rank = bisect_left(positions, index)
+        return rank < len(positions) and positions[rank] == index
+
+    def rank(self, index: int) -> int:
+        """Number of selectable options before index"""
+        return bisect_left(self.positions, index)
+
+    def first(self) -> Optional[int]:
+        return self.positions[0] if self.positions else None
+
+    def last(self) -> Optional[int]:
+        return self.positions[-1] if self.positions else None
+
+    def at_or_after(self, index: int) -> Optional[int]:
+        """First selectable option at or after index"""
+        rank = bisect_left(self.positions, index)
+        return self.positions[rank] if rank < len(self.positions) else None
+
+    def at_or_before(self, index: int) -> Optional[int]:
+        """Last selectable option at or before index"""
+        rank = bisect_right(self.positions, index)
+        return self.positions[rank - 1] if rank else None
+
+    def step(self, index: int, delta: int, wrap: bool = True) -> int:
+        """Move delta selectable options away from index
+
+        Wrapping moves (arrow keys) go around the ends of the menu; non
+        wrapping moves (page keys) stop at the first or last option.
+        Returns index unchanged when nothing is selectable.
+        """
+        positions = self.positions
+        if not positions or not delta:
+            return index
+
+        rank = bisect_left(positions, index)
+        if delta > 0 and not (rank < len(positions) and positions[rank] == index):
+            rank -= 1  # Not selectable: the next option down is one step away
+        target = rank + delta
+        if wrap:
+            target %= len(positions)
+        else:
+            target = min(max(target, 0), len(positions) - 1)
+        return positions[target]
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Performance Monitor - Per-frame timing for cyberpunk menus
+
+A menu given a PerfMonitor records how long each phase of every frame took:
+waiting for input, reading/decoding keys, updating menu state, each theme
+render call and the terminal write, plus the latency from a key arriving
+to the frame that shows its effect and the bytes the frame sent. Finished frames go to observer
+callbacks and into histograms: rolling windows for p50/p99 (shown by the
+on-screen HUD) and cumulative buckets for Prometheus text-file export.
+"""
+
+import os
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Sequence
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" labels)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Bucket upper bounds for bytes written per frame
+BYTE_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 65536)
+
+# Phases reported for a frame (theme render phases are named after the call)
+INPUT_WAIT = "input_wait"
+KEY_DECODE = "key_decode"
+UPDATE = "update"
+WRITE = "write"
+
+
+class FrameTimings(NamedTuple):
+    """Timings of one finished frame, in seconds"""
+    phases: Dict[str, float]     # Phase name -> time spent in it this frame
+    total: float                 # Sum of all phases
+    latency: Optional[float]     # First key of the frame to frame written, if any
+    timestamp: float             # perf_counter() when the frame was written
+    bytes_written: int = 0       # Bytes sent to the terminal
+
+
+class Histogram:
+    """Cumulative bucket counts plus a rolling window of recent samples"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = 1000):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)   # Samples <= each bound (non-cumulative)
+        self.count = 0
+        self.sum = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Percentile of the rolling window (fraction 0.5 = p50), None if empty"""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def cumulative(self) -> List[int]:
+        """Prometheus-style cumulative counts for each bucket bound"""
+        total, result = 0, []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class PerfMonitor:
+    """Collects per-frame phase timings from a CyberpunkMenu"""
+
+    def __init__(self, window: int = 1000, export_path: Optional[str] = None,
+                 hud: bool = False):
+        self.window = window
+        self.export_path = export_path   # Prometheus text file written when a run ends
+        self.hud = hud                   # Show the FPS/latency overlay
+        self.histograms: Dict[str, Histogram] = {}
+        self.latency = Histogram(window=window)
+        self.frames = Histogram(window=window)
+        self.frame_bytes = Histogram(BYTE_BUCKETS, window=window)
+        self._observers: List[Callable[[FrameTimings], None]] = []
+        self._frame_times: Deque[float] = deque(maxlen=240)
+        self._phases: Dict[str, float] = {}
+        self._key_time: Optional[float] = None
+        self._last = time.perf_counter()
+
+    def add_observer(self, observer: Callable[[FrameTimings], None]) -> None:
+        """Call observer with the FrameTimings of every finished frame"""
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: Callable[[FrameTimings], None]) -> None:
+        self._observers.remove(observer)
+
+    def lap(self) -> None:
+        """Start timing from now, discarding time not attributed to a phase"""
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Attribute the time since the previous mark to phase"""
+        now = time.perf_counter()
+        self._phases[phase] = self._phases.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def key_ready(self) -> None:
+        """End the input wait; the frame's latency is measured from here"""
+        self.mark(INPUT_WAIT)
+        if self._key_time is None:
+            self._key_time = self._last
+
+    def end_frame(self, bytes_written: Optional[int] = None) -> FrameTimings:
+        """Close the current frame and report it"""
+        now = time.perf_counter()
+        phases, self._phases = self._phases, {}
+        latency = now - self._key_time if self._key_time is not None else None
+        self._key_time = None
+        timings = FrameTimings(phases, sum(phases.values()), latency, now, bytes_written or 0)
+
+        for phase, seconds in phases.items():
+            histogram = self.histograms.get(phase)
+            if histogram is None:
+                histogram = self.histograms[phase] = Histogram(window=self.window)
+            histogram.observe(seconds)
+        # Waiting for the user is not part of the frame's cost
+        self.frames.observe(timings.total - phases.get(INPUT_WAIT, 0.0))
+        if latency is not None:
+            self.latency.observe(latency)
+        if bytes_written is not None:
+            self.frame_bytes.observe(bytes_written)
+        self._frame_times.append(now)
+
+        for observer in self._observers:
+            observer(timings)
+        return timings
+
+    @property
+    def fps(self) -> float:
+        """Frames drawn during the last second"""
+        cutoff = time.perf_counter() - 1.0
+        return float(sum(1 for stamp in self._frame_times if stamp >= cutoff))
+
+    def hud_text(self) -> str:
+        """One-line FPS, key-to-frame latency and frame size summary for the overlay"""
+        p50 = self.latency.percentile(0.5)
+        p99 = self.latency.percentile(0.99)
+        size = self.frame_bytes.percentile(0.5)
+        size_text = f"  {size:.0f} B" if size is not None else ""
+        if p50 is None:
+            return f" {self.fps:.0f} fps  latency --{size_text} "
+        return f" {self.fps:.0f} fps  p50 {p50 * 1000:.1f} ms  p99 {p99 * 1000:.1f} ms{size_text} "
+
+    def prometheus_text(self) -> str:
+        """Histograms in the Prometheus text exposition format"""
+        lines = [
+            "# HELP cyberpunk_menu_phase_seconds Time spent in each phase of a menu frame",
+            "# TYPE cyberpunk_menu_phase_seconds histogram",
+        ]
+        for phase, histogram in sorted(self.histograms.items()):
+            lines.extend(self._histogram_lines("cyberpunk_menu_phase_seconds", histogram,
+                                               f'phase="{phase}"'))
+        for name, histogram, help_text in (
+            ("cyberpunk_menu_key_to_frame_seconds", self.latency,
+             "Time from a key arriving to the frame showing its effect"),
+            ("cyberpunk_menu_frame_seconds", self.frames,
+             "Time spent producing a frame, excluding the input wait"),
+            ("cyberpunk_menu_frame_bytes", self.frame_bytes,
+             "Bytes written to the terminal per frame"),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            lines.extend(self._histogram_lines(name, histogram, ""))
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Optional[str] = None) -> None:
+        """Write prometheus_text() atomically (as node_exporter's textfile collector expects)"""
+        path = path or self.export_path
+        if not path:
+            return
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as f:
+            f.write(self.prometheus_text())
+        os.replace(temporary, path)
+
+    @staticmethod
+    def _histogram_lines(name: str, histogram: Histogram, labels: str) -> List[str]:
+        prefix = labels + "," if labels else ""
+        lines = [f'{name}_bucket{{{prefix}le="{bound}"}} {count}'
+                 for bound, count in zip(histogram.buckets, histogram.cumulative())]
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {histogram.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {histogram.sum}")
+        lines.append(f"{name}_count{suffix} {histogram.count}")
+        return lines
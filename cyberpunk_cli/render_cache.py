@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Render Cache - Memoized ANSI output for theme render calls
+
+Theme chrome (logo, subtitle, footer) never changes for a given theme,
+layout tier, terminal width and color system, and a menu row only depends on its option
+and selection state. Both are captured once as pre-encoded ANSI lines so the
+per-keystroke path skips building and segmenting Rich renderables.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from rich.console import Console
+
+
+def capture_lines(console: Console, render: Callable[[Console], None]) -> List[str]:
+    """Capture a render call as a list of ANSI-encoded lines"""
+    with console.capture() as capture:
+        render(console)
+    return capture.get().splitlines()
+
+
+class RenderCache:
+    """Bounded LRU caches for theme chrome and menu rows"""
+
+    CHROME_PARTS = ("logo", "subtitle", "footer")
+    CHROME_TIERS = ("full", "compact", "line")
+
+    def __init__(self, max_rows: int = 4096, max_chrome: int = 64):
+        self.max_rows = max_rows
+        self.max_chrome = max_chrome
+        self._chrome: "OrderedDict[Tuple, List[str]]" = OrderedDict()
+        self._rows: "OrderedDict[Tuple, List[str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def chrome(self, theme, part: str, console: Console,
+               tier: Optional[str] = None) -> List[str]:
+        """Get the lines of a static theme element ("logo", "subtitle", "footer")
+
+        tier ("full", "compact" or "line") defaults to the one the theme picks
+        for the console size.
+        """
+        if part not in self.CHROME_PARTS:
+            raise ValueError(f"Unknown chrome part: {part}")
+        width, height = console.size
+        if tier is None:
+            tier = theme.layout_tier(width, height)
+        elif tier not in self.CHROME_TIERS:
+            raise ValueError(f"Unknown chrome tier: {tier}")
+        key = (theme, part, tier, width, console.color_system)
+        render = getattr(theme, f"render_{part}" if tier == "full" else f"render_{part}_{tier}")
+        return self._lookup(self._chrome, self.max_chrome, key,
+                            lambda: capture_lines(console, render))
+
+    def row(self, theme, option, selected: bool, console: Console) -> List[str]:
+        """Get the lines of a menu option or separator row"""
+        key = (theme, console.width, console.color_system, option, selected)
+
+        def render() -> List[str]:
+            if option.key == "separator":
+                renderable = theme.render_separator(option.name)
+            else:
+                renderable = theme.render_menu_item(option.name, option.description, selected)
+            # One screen row per option keeps viewport and mouse math exact
+            return capture_lines(console, lambda c: c.print(
+                renderable, no_wrap=True, overflow="ellipsis"))
+
+        return self._lookup(self._rows, self.max_rows, key, render)
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._chrome.clear()
+        self._rows.clear()
+
+    def _lookup(self, cache: "OrderedDict[Tuple, List[str]]", limit: int,
+                key: Hashable, render: Callable[[], List[str]]) -> List[str]:
+        """LRU lookup, rendering and storing on a miss"""
+        lines = cache.get(key)
+        if lines is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+            return lines
+
+        self.misses += 1
+        lines = render()
+        cache[key] = lines
+        if len(cache) > limit:
+            cache.popitem(last=False)
+        return lines
+
+
+# Global render cache shared by all menus
+render_cache = RenderCache()
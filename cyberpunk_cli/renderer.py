@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Frame Renderer - Incremental terminal repaint for cyberpunk menus
+
+Keeps the previously drawn frame as a line buffer and, on the next frame,
+rewrites only the lines that changed using absolute cursor positioning.
+A full clear-and-repaint only happens on the first frame, after a resize,
+after a theme change, or when explicitly invalidated.
+
+Each frame is assembled into one string and handed to the terminal with a
+single os.write(), wrapped in synchronized-update mode (DEC 2026) so the
+terminal shows it all at once instead of half-drawn.
+
+In low-bandwidth mode (slow SSH links, serial consoles) lines are re-encoded
+with minimal SGR transitions, cursor moves use the shortest sequence that
+gets there and lines are only cleared when the old text was wider.
+"""
+
+import os
+import select
+from typing import Dict, List, Optional, Tuple
+
+from rich.cells import cell_len
+from rich.console import Console
+
+from .sgr import minimize_sgr, strip_sgr
+
+
+# ANSI control sequences
+CURSOR_HOME = "\x1b[H"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+REVERSE = "\x1b[7m"
+RESET = "\x1b[0m"
+
+# Synchronized output: the terminal holds the screen until the frame is complete
+SYNC_START = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+
+# Terminals known to mishandle private modes they don't implement
+_NO_SYNC_TERMS = ("", "dumb", "linux")
+
+
+def move_to(row: int, col: int = 1) -> str:
+    """Absolute cursor position (1-based)"""
+    return f"\x1b[{row};{col}H"
+
+
+def cheapest_move(row: Optional[int], at_line_start: bool, target: int) -> str:
+    """Shortest way to the start of target from row (None = unknown position)"""
+    absolute = CURSOR_HOME if target == 1 else f"\x1b[{target}H"
+    if row is None:
+        return absolute
+    relative = "" if at_line_start else "\r"
+    distance = target - row
+    if distance > 0:
+        # Line feeds are cheapest for short hops (the frame never reaches the bottom row)
+        relative += min("\n" * distance, f"\x1b[{distance}B", key=len)
+    elif distance < 0:
+        relative += "\x1b[A" if distance == -1 else f"\x1b[{-distance}A"
+    return absolute if len(absolute) <= len(relative) else relative
+
+
+def synchronized_output_supported() -> bool:
+    """Whether to wrap frames in DEC 2026 synchronized-update mode
+
+    Terminals that don't implement the mode ignore it, as they must any
+    unknown private mode, so it is only left out where that isn't reliable.
+    """
+    return os.environ.get("TERM", "") not in _NO_SYNC_TERMS
+
+
+class FrameRenderer:
+    """Line-buffered renderer that repaints only changed lines"""
+
+    def __init__(self, console: Console, synchronized: Optional[bool] = None,
+                 low_bandwidth: bool = False):
+        self.console = console
+        self.low_bandwidth = low_bandwidth
+        # Wrap frames in synchronized-update mode (None = detect from $TERM;
+        # off on slow links, where the extra bytes are rarely worth it)
+        if synchronized is None:
+            synchronized = synchronized_output_supported() and not low_bandwidth
+        self.synchronized = synchronized
+        self.bytes_written = 0  # Size of the last frame sent
+        self.total_bytes = 0
+        self.previous: List[Optional[str]] = []
+        self._minimized: Dict[str, str] = {}  # Input line -> low-bandwidth encoding
+        self._widths: Dict[str, Optional[int]] = {}  # Encoded line -> cells, None if unknown
+        self._size: Optional[Tuple[int, int]] = None
+        self._theme_name: Optional[str] = None
+
+    def invalidate(self) -> None:
+        """Force a full repaint on the next frame"""
+        self.previous = []
+        self._size = None
+
+    def needs_full_repaint(self, theme_name: str, size: Tuple[int, int]) -> bool:
+        """Check whether the next frame must be repainted from scratch"""
+        return (
+            not self.previous or
+            size != self._size or
+            theme_name != self._theme_name
+        )
+
+    def draw(self, lines: List[str], theme_name: str, overlay: Optional[str] = None) -> int:
+        """Draw a frame given as pre-rendered ANSI lines, returning the bytes sent
+
+        overlay, if given, is plain text drawn in reverse video over the
+        top-right corner of the frame (used by the performance HUD).
+        """
+        console = self.console
+        if self.low_bandwidth:
+            lines = [self._minimize(line) for line in lines]
+
+        if not console.is_terminal:
+            # No cursor control on pipes/files, just emit the frame
+            self.bytes_written = self._write("\n".join(lines) + "\n")
+            self.total_bytes += self.bytes_written
+            self.previous = list(lines)
+            return self.bytes_written
+
+        size = (console.size.width, console.size.height)
+
+        # Frames taller than the screen scroll, so row positions are unreliable
+        fits = len(lines) < size[1]
+        if self.needs_full_repaint(theme_name, size) or not fits:
+            output = [CURSOR_HOME, CLEAR_SCREEN, "\n".join(lines), "\n"]
+        else:
+            output = self._diff(lines)
+
+        overlay = overlay[:size[0]] if overlay and fits and lines else None
+        if overlay:
+            output.append(move_to(1, size[0] - len(overlay) + 1))
+            output.append(REVERSE + overlay + RESET)
+            output.append(move_to(len(lines) + 1))
+
+        if self.synchronized:
+            output.insert(0, SYNC_START)
+            output.append(SYNC_END)
+        self.bytes_written = self._write("".join(output))
+        self.total_bytes += self.bytes_written
+        self.previous = list(lines)
+        if overlay:
+            self.previous[0] = None  # Covered by the overlay, rewrite it next frame
+        self._size = size
+        self._theme_name = theme_name
+        return self.bytes_written
+
+    def _diff(self, lines: List[str]) -> List[str]:
+        """Build the escape sequences that turn the previous frame into this one"""
+        if self.low_bandwidth:
+            return self._diff_low_bandwidth(lines)
+        previous = self.previous
+        output = []
+
+        for row, line in enumerate(lines):
+            if row < len(previous) and previous[row] == line:
+                continue
+            output.append(move_to(row + 1))
+            output.append(line)
+            output.append(CLEAR_LINE)
+
+        # Park the cursor below the frame, wiping any leftover lines
+        output.append(move_to(len(lines) + 1))
+        if len(lines) < len(previous):
+            output.append(CLEAR_BELOW)
+        return output
+
+    def _diff_low_bandwidth(self, lines: List[str]) -> List[str]:
+        """_diff() spending as few bytes as possible
+
+        When the changed rows are the old ones moved up or down (scrolling),
+        the terminal is asked to scroll that region and only the rows that
+        come into view are sent.
+        """
+        previous = self.previous
+        best = self._diff_rows(lines, previous)
+        if len(lines) != len(previous):
+            return best
+
+        changed = [row for row, line in enumerate(lines) if previous[row] != line]
+        if len(changed) < 2:
+            return best
+        top, bottom = changed[0], changed[-1]
+        shifts = {1, -1}
+        for row in range(top + 1, bottom + 1):
+            if previous[row] == lines[top]:
+                shifts.add(row - top)  # Content moved up by this many rows
+            if lines[row] == previous[top]:
+                shifts.add(top - row)  # ...or down
+        size = len("".join(best))
+        for shift in shifts:
+            if abs(shift) > bottom - top:
+                continue
+            candidate = self._scroll(top, bottom, shift) + self._diff_rows(
+                lines, self._scrolled(previous, top, bottom, shift))
+            candidate_size = len("".join(candidate))
+            if candidate_size < size:
+                best, size = candidate, candidate_size
+        return best
+
+    @staticmethod
+    def _scroll(top: int, bottom: int, shift: int) -> List[str]:
+        """Scroll screen rows top..bottom (0-based) up by shift rows (down if negative)
+
+        Uses a scroll region with line feeds and reverse index, which even
+        VT100-class serial terminals understand. Resetting the region homes
+        the cursor.
+        """
+        region = f"\x1b[{top + 1};{bottom + 1}r"
+        if shift > 0:
+            return [region, move_to(bottom + 1), "\n" * shift, "\x1b[r"]
+        return [region, move_to(top + 1), "\x1bM" * -shift, "\x1b[r"]
+
+    @staticmethod
+    def _scrolled(previous: List[Optional[str]], top: int, bottom: int,
+                  shift: int) -> List[Optional[str]]:
+        """Screen contents after _scroll()"""
+        screen = list(previous)
+        region = previous[top:bottom + 1]
+        blank = [""] * abs(shift)
+        if shift > 0:
+            screen[top:bottom + 1] = region[shift:] + blank
+        else:
+            screen[top:bottom + 1] = blank + region[:shift]
+        return screen
+
+    def _diff_rows(self, lines: List[str], screen: List[Optional[str]]) -> List[str]:
+        """Rewrite the rows that differ from screen, with the cheapest moves
+
+        The first move of a frame is absolute, since other output may have
+        moved the cursor since the last one; later moves are relative.
+        """
+        screen_width = self.console.size.width
+        output = []
+        cursor: Optional[int] = None
+        at_line_start = True
+
+        for row, line in enumerate(lines, 1):
+            old = screen[row - 1] if row <= len(screen) else None
+            if old is not None and old == line:
+                continue
+            output.append(cheapest_move(cursor, at_line_start, row))
+            output.append(line)
+            # Clearing is only needed where the old line stuck out past the new one
+            width = self._width(line)
+            old_width = self._width(old) if old is not None else None
+            if width is None or old_width is None or width < min(old_width, screen_width):
+                output.append(CLEAR_LINE)
+            cursor, at_line_start = row, False
+
+        output.append(cheapest_move(cursor, at_line_start, len(lines) + 1))
+        if len(lines) < len(screen):
+            output.append(CLEAR_BELOW)
+        return output
+
+    def _minimize(self, line: str) -> str:
+        """Low-bandwidth encoding of a line (memoized, lines repeat between frames)"""
+        minimized = self._minimized.get(line)
+        if minimized is None:
+            if len(self._minimized) >= 4096:
+                self._minimized.clear()
+                self._widths.clear()
+            minimized = self._minimized[line] = minimize_sgr(line)
+        return minimized
+
+    def _width(self, line: str) -> Optional[int]:
+        """Cells a line covers, None if it has escapes other than SGR"""
+        if line not in self._widths:
+            text = strip_sgr(line)
+            self._widths[line] = None if "\x1b" in text else cell_len(text)
+        return self._widths[line]
+
+    def _write(self, data: str) -> int:
+        """Write raw terminal output, straight to the file descriptor if there is one
+
+        Returns the number of bytes written.
+        """
+        file = self.console.file
+        try:
+            fd = file.fileno()
+        except (AttributeError, OSError, ValueError):
+            # In-memory or wrapped streams (tests, capture)
+            file.write(data)
+            file.flush()
+            return len(data.encode("utf-8"))
+
+        file.flush()  # Anything printed earlier must come first
+        encoded = memoryview(data.encode(getattr(file, "encoding", None) or "utf-8", "replace"))
+        size = len(encoded)
+        while encoded:
+            try:
+                written = os.write(fd, encoded)
+            except BlockingIOError:
+                # Non-blocking stdout (e.g. shared with an event loop): wait for room
+                select.select([], [fd], [])
+                continue
+            encoded = encoded[written:]
+        return size
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Search Index - Incremental fuzzy filtering for large menus
+
+Option texts are laid out back to back (one line per option) and indexed as
+character postings stored as bitsets: bit p of the mask for "a" is set when
+position p holds an "a". A fuzzy (subsequence) match is then a handful of
+big-integer operations per typed character, all running in C, instead of a
+Python loop over every option:
+
+    hits  = reach & postings[char]        # char found somewhere reachable
+    reach = fill((hits << 1) & interior)  # everything after it on that line
+
+Each keystroke advances the state left by the previous one, and backspace
+pops back to it, so typing never rescans from scratch. Inserting, removing
+or replacing a text splices its bits into every bitset in place of
+reindexing the rest. Results are ranked
+as name prefix matches, then substring matches, then fuzzy matches, each
+tier in menu order.
+"""
+
+from itertools import compress
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class _SearchState(NamedTuple):
+    """Match bitsets after consuming a query prefix"""
+    query: str
+    reach: int       # positions a further query character may occupy
+    hits: int        # positions of the last character of a fuzzy match
+    substring: int   # positions where the query ends as a contiguous substring
+    prefix: int      # same, restricted to substrings starting a line
+
+
+# Rank tier of a line, encoded in the byte holding its newline bit
+_FUZZY = 0x80
+_SUBSTRING = 0x40
+_PREFIX = 0x20
+_TIER_VALUES = [_FUZZY | _SUBSTRING | _PREFIX, _FUZZY | _SUBSTRING, _FUZZY]
+_TIERS = {tier: bytes(1 if value == tier else 0 for value in range(256))
+          for tier in _TIER_VALUES}
+
+# Extractions shorter than this hop between matches with bytes.find()
+_SPARSE_TIER = 256
+
+
+class SearchIndex:
+    """Bitset character postings over a growing list of texts"""
+
+    def __init__(self, texts: Iterable[str] = ()):
+        self.size = 0                 # Number of indexed texts
+        self._length = 0              # Number of indexed positions
+        self._postings = {}           # char -> bitset of positions
+        self._newlines = 0            # Bitset of line terminators
+        self._starts = 0              # Bitset of first positions of lines
+        self._interior = 0            # Every position that is not a terminator
+        self._newline_bytes: List[int] = []
+        self._gather: Optional[itemgetter] = None
+        self._states: List[_SearchState] = []
+        self.extend(texts)
+
+    def extend(self, texts: Iterable[str]) -> None:
+        """Index more texts, appended after the existing ones"""
+        bitsets, width, terminators = self._layout(texts)
+        if not terminators:
+            return
+
+        base = self._length
+        postings = self._postings
+        for char, bits in bitsets.items():
+            bits <<= base
+            if char == "\n":
+                self._newlines |= bits
+            else:
+                postings[char] = postings.get(char, 0) | bits
+        self._newline_bytes.extend(base // 8 + byte for byte in terminators)
+        self._length += width
+        self.size += len(terminators)
+        self._derive()
+
+    def insert(self, index: int, text: str) -> None:
+        """Index a text before the one at index, shifting the later ones"""
+        self._splice(index, 0, [text])
+
+    def remove(self, index: int) -> None:
+        """Drop the text at index, shifting the later ones"""
+        self._splice(index, 1, [])
+
+    def replace(self, index: int, text: str) -> None:
+        """Index a new text in place of the one at index"""
+        self._splice(index, 1, [text])
+
+    def _splice(self, index: int, count: int, texts: List[str]) -> None:
+        """Replace count texts from index with texts, keeping the rest indexed
+
+        Every bitset keeps its bits below the spliced lines, takes the new
+        lines' bits, and has the bits above shifted by the change in width.
+        """
+        newline_bytes = self._newline_bytes
+        start = (newline_bytes[index - 1] + 1) * 8 if index else 0
+        stop = (newline_bytes[index + count - 1] + 1) * 8 if index + count else 0
+        bitsets, width, terminators = self._layout(texts)
+
+        below = (1 << start) - 1
+        above = start + width
+
+        def splice(bits: int, new: int) -> int:
+            return (bits & below) | (new << start) | ((bits >> stop) << above)
+
+        self._newlines = splice(self._newlines, bitsets.pop("\n", 0))
+        postings = self._postings
+        for char in set(postings).union(bitsets):
+            bits = splice(postings.get(char, 0), bitsets.get(char, 0))
+            if bits:
+                postings[char] = bits
+            else:
+                del postings[char]
+
+        shift = (width - (stop - start)) // 8
+        newline_bytes[index:] = (
+            [start // 8 + byte for byte in terminators]
+            + [byte + shift for byte in newline_bytes[index + count:]]
+        )
+        self._length += width - (stop - start)
+        self.size += len(texts) - count
+        self._derive()
+
+    @classmethod
+    def _layout(cls, texts: Iterable[str]) -> Tuple[Dict[str, int], int, List[int]]:
+        """Bitsets of texts laid out from position 0
+
+        Returns the bitset of each character ("\n" for the terminators), the
+        number of positions taken and the byte holding each terminator.
+        """
+        lines = []
+        terminators = []
+        width = 0
+        for text in texts:
+            text = text.lower().replace("\n", " ").replace("\0", " ")
+            # Pad so each terminator is the top bit of a byte, which lets
+            # search() read one byte per line straight out of the bitset
+            length = len(text) + 1
+            padded = (length + 7) // 8 * 8
+            lines.append(text + "\0" * (padded - length) + "\n")
+            width += padded
+            terminators.append((width - 1) // 8)
+        if not lines:
+            return {}, 0, []
+
+        # int(..., 2) reads the most significant digit first, so reverse
+        segment = "".join(lines)[::-1]
+        bitsets = {char: bits for char, bits in cls._bitsets(segment) if char != "\0"}
+        return bitsets, width, terminators
+
+    def _derive(self) -> None:
+        """Recompute what depends on the layout after texts changed"""
+        everything = (1 << self._length) - 1
+        self._interior = everything ^ self._newlines
+        self._starts = ((self._newlines << 1) | 1) & everything
+        self._gather = None  # Rebuilt by the next search that ranks
+        self._states = [_SearchState("", self._interior, 0, 0, 0)]
+
+    @staticmethod
+    def _bitsets(segment: str) -> Iterator[Tuple[str, int]]:
+        """Yield (char, bitset of its positions) for every char in segment
+
+        Characters are first coded as single bytes so that each bitset costs
+        one bytes.translate() and one int() parse. Beyond 255 distinct
+        characters the rest share code 255 and use the slower str.translate().
+        """
+        chars = sorted(set(segment))
+        coded, rest = chars[:255], chars[255:]
+        table = {ord(char): code for code, char in enumerate(coded)}
+        table.update((ord(char), 255) for char in rest)
+        data = segment.translate(table).encode("latin-1")
+        for code, char in enumerate(coded):
+            table = bytearray(b"0" * 256)
+            table[code] = ord("1")
+            yield char, int(data.translate(bytes(table)), 2)
+
+        zeros = {ord(char): "0" for char in chars}
+        for char in rest:
+            table = dict(zeros)
+            table[ord(char)] = "1"
+            yield char, int(segment.translate(table), 2)
+
+    def search(self, query: str) -> Sequence[int]:
+        """Return indices of texts fuzzily matching query, best tier first"""
+        query = query.lower()
+        if not self.size:
+            return []
+
+        # Resume from the longest query prefix already computed
+        states = self._states
+        while len(states) > 1 and not query.startswith(states[-1].query):
+            states.pop()
+        state = states[-1]
+        for char in query[len(state.query):]:
+            state = self._advance(state, char)
+            states.append(state)
+
+        if not state.query:
+            return range(self.size)
+        return self._rank(state)
+
+    def _advance(self, state: _SearchState, char: str) -> _SearchState:
+        """Consume one more query character"""
+        postings = self._postings.get(char, 0)
+        hits = state.reach & postings
+        reach = self._fill((hits << 1) & self._interior)
+        if state.query:
+            substring = (state.substring << 1) & postings
+            prefix = (state.prefix << 1) & postings
+        else:
+            substring = postings
+            prefix = postings & self._starts
+        return _SearchState(state.query + char, reach, hits, substring, prefix)
+
+    def _fill(self, bits: int) -> int:
+        """Set every position from the first set bit of each line up to its end
+
+        Adding the start bits to the all-ones interior carries through the
+        rest of the line and stops at its terminator.
+        """
+        interior = self._interior
+        return (((interior + bits) ^ interior) | bits) & interior
+
+    def _line_flags(self, bits: int) -> int:
+        """Move "any bit set on this line" onto the line's terminator bit"""
+        return (self._fill(bits) << 1) & self._newlines
+
+    def _rank(self, state: _SearchState) -> "SearchResults":
+        """Tag each matching line with its rank tier"""
+        flags = (
+            self._line_flags(state.hits)
+            | self._line_flags(state.substring) >> 1
+            | self._line_flags(state.prefix) >> 2
+        )
+        data = flags.to_bytes(self._length // 8 + 1, "little")
+        if self._gather is None:
+            self._gather = itemgetter(*self._newline_bytes)
+        tiers = self._gather(data)
+        tiers = bytes(tiers) if self.size > 1 else bytes([tiers])
+
+        return SearchResults(tiers)
+
+
+class SearchResults(Sequence):
+    """Ranked match indices, materialized lazily as positions are accessed
+
+    Only the rows a menu actually shows are extracted, so the cost of a
+    filter does not grow with the number of matches.
+    """
+
+    def __init__(self, tiers: bytes):
+        self._tiers = tiers
+        self._length = sum(tiers.count(value) for value in _TIER_VALUES)
+        self._items: List[int] = []
+        self._tier = 0     # Tier currently being extracted
+        self._start = 0    # Next line to look at within that tier
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            stop = position.indices(self._length)[1]
+            self._materialize(stop)
+            return self._items[position]
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("search result index out of range")
+        self._materialize(position + 1)
+        return self._items[position]
+
+    def __iter__(self) -> Iterator[int]:
+        self._materialize(self._length)
+        return iter(self._items)
+
+    def _materialize(self, count: int) -> None:
+        """Extract matches until at least count are available"""
+        items, tiers = self._items, self._tiers
+        while len(items) < count and self._tier < len(_TIER_VALUES):
+            value = _TIER_VALUES[self._tier]
+            if count - len(items) > _SPARSE_TIER:
+                # Long jump: take the rest of this tier in one C-level pass
+                start = self._start
+                flags = tiers[start:].translate(_TIERS[value])
+                items.extend(compress(range(start, len(tiers)), flags))
+                position = -1
+            else:
+                position = tiers.find(value, self._start)
+            if position < 0:
+                self._tier += 1
+                self._start = 0
+            else:
+                items.append(position)
+                self._start = position + 1
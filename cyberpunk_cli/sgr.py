@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+SGR Minimizer - Smallest style escapes for pre-rendered ANSI lines
+
+Rich encodes every styled segment on its own: the full set of attributes,
+the text, then a reset. Adjacent segments that share most attributes pay
+for them again, and padding spaces carry a foreground colour nobody can
+see. minimize_sgr() replays a line through a model of the terminal's
+graphic state and emits only the transitions that change what is shown,
+choosing between switching attributes off one by one and a reset,
+whichever is shorter. Lines always end with all attributes off, and
+trailing blanks are dropped: the caller clears to the end of the line.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+_SGR = re.compile(r"\x1b\[([0-9;]*)m")
+
+# Attributes set by simple codes
+_SIMPLE = {
+    "1": "bold", "2": "dim", "3": "italic", "4": "underline", "21": "underline",
+    "5": "blink", "6": "blink", "7": "reverse", "8": "conceal", "9": "strike",
+    "51": "frame", "52": "frame", "53": "overline",
+}
+
+# Codes that turn attributes off
+_OFF = {
+    "22": ("bold", "dim"), "23": ("italic",), "24": ("underline",), "25": ("blink",),
+    "27": ("reverse",), "28": ("conceal",), "29": ("strike",), "54": ("frame",),
+    "55": ("overline",), "39": ("fg",), "49": ("bg",), "59": ("underline_color",),
+}
+
+_OFF_CODE = {attribute: code for code, attributes in _OFF.items() for attribute in attributes}
+
+# Extended colour introducers
+_EXTENDED = {"38": "fg", "48": "bg", "58": "underline_color"}
+
+# Attributes that show on a space character (a foreground colour doesn't)
+_VISIBLE_ON_SPACE = ("bg", "reverse", "underline", "underline_color", "strike",
+                     "overline", "frame", "conceal")
+
+State = Dict[str, str]
+
+
+def strip_sgr(line: str) -> str:
+    """Text of a line without its SGR sequences"""
+    return _SGR.sub("", line)
+
+
+def _apply(state: State, params: str) -> Optional[State]:
+    """State after an SGR sequence, None if it uses codes we don't model"""
+    codes = params.split(";") if params else ["0"]
+    state = dict(state)
+    i = 0
+    while i < len(codes):
+        code = codes[i] or "0"
+        if code == "0":
+            state.clear()
+        elif code in _SIMPLE:
+            state[_SIMPLE[code]] = code
+        elif code in _OFF:
+            for attribute in _OFF[code]:
+                state.pop(attribute, None)
+        elif code in _EXTENDED:
+            mode = codes[i + 1] if i + 1 < len(codes) else ""
+            count = {"5": 1, "2": 3}.get(mode)
+            if count is None or i + 2 + count > len(codes):
+                return None
+            state[_EXTENDED[code]] = ";".join(codes[i:i + 2 + count])
+            i += 1 + count
+        elif code.isdigit() and (30 <= int(code) <= 37 or 90 <= int(code) <= 97):
+            state["fg"] = code
+        elif code.isdigit() and (40 <= int(code) <= 47 or 100 <= int(code) <= 107):
+            state["bg"] = code
+        else:
+            return None
+        i += 1
+    return state
+
+
+def transition(current: State, target: State) -> str:
+    """Shortest SGR sequence turning the current state into target"""
+    if current == target:
+        return ""
+    if not target:
+        return "\x1b[m"
+
+    # Either switch off what goes away and set what changes...
+    params: List[str] = []
+    removed = [attribute for attribute in current if attribute not in target]
+    intensity_off = any(attribute in ("bold", "dim") for attribute in removed)
+    if intensity_off:
+        params.append("22")  # Clears both bold and dim; whichever stays is set again
+    params.extend(_OFF_CODE[attribute] for attribute in removed
+                  if attribute not in ("bold", "dim"))
+    for attribute, value in target.items():
+        if current.get(attribute) != value or (intensity_off and attribute in ("bold", "dim")):
+            params.append(value)
+    selective = "\x1b[" + ";".join(params) + "m"
+
+    # ...or reset and set everything
+    reset = "\x1b[0;" + ";".join(target.values()) + "m"
+    return selective if len(selective) <= len(reset) else reset
+
+
+def minimize_sgr(line: str) -> str:
+    """Re-encode a line's SGR sequences as the minimal transitions"""
+    # Split into (text, state) runs
+    runs = []
+    state: State = {}
+    position = 0
+    for match in _SGR.finditer(line):
+        if match.start() > position:
+            runs.append((line[position:match.start()], state))
+        state = _apply(state, match.group(1))
+        if state is None:
+            return line  # Something we don't model, leave the line alone
+        position = match.end()
+    if position < len(line):
+        runs.append((line[position:], state))
+
+    # Blanks at the end look like the cleared rest of the line
+    while runs and _blank(*runs[-1]):
+        text, state = runs.pop()
+        text = text.rstrip(" ")
+        if text:
+            runs.append((text, state))
+            break
+
+    output: List[str] = []
+    current: State = {}
+    for text, state in runs:
+        if not text.strip(" ") and all(
+                current.get(attribute) == state.get(attribute) for attribute in _VISIBLE_ON_SPACE):
+            output.append(text)  # Spaces look the same either way, skip the change
+            continue
+        output.append(transition(current, state))
+        output.append(text)
+        current = state
+    output.append(transition(current, {}))
+    return "".join(output)
+
+
+def _blank(text: str, state: State) -> bool:
+    """True if text ends with spaces that look like empty cells"""
+    return text.endswith(" ") and not any(attribute in state for attribute in _VISIBLE_ON_SPACE)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Submenus - Lazily built child menus for hierarchical menus
+
+A submenu option holds a builder instead of its children: a callable that
+returns a ready CyberpunkMenu, or an iterable (typically a generator) of
+options. Nothing is built until the option is first entered, so a tree
+with thousands of leaves opens as fast as its top level. Built children
+are kept in a SubmenuCache, a bounded LRU keyed by the path of option keys
+that leads to them; an evicted child is simply built again next time.
+
+Iterable builders yield one item per option:
+    (key, name, description)            a plain option
+    (key, name, description, builder)   a nested submenu
+    MenuOption(...)                     an option as stored by the menu
+    "separator"                         a separator row
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable
+
+# A builder: called on first entry, returns a CyberpunkMenu or an iterable of options
+SubmenuSource = Callable[[], Any]
+
+# Built submenus kept per menu tree
+SUBMENU_CACHE_SIZE = 64
+
+
+def populate(menu, items: Iterable[Any]) -> None:
+    """Add the options yielded by an iterable builder to a menu"""
+    for item in items:
+        if item == "separator":
+            menu.add_separator()
+        elif len(item) == 4:
+            menu.add_submenu(*item)
+        elif item[0] == "separator":
+            menu.add_separator()
+        else:
+            key, name, description = item
+            menu.add_option(key, name, description)
+
+
+class SubmenuCache:
+    """Bounded LRU of built submenus, keyed by their path from the root"""
+
+    def __init__(self, max_menus: int = SUBMENU_CACHE_SIZE):
+        self.max_menus = max_menus
+        self._menus: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._menus)
+
+    def get(self, path: Hashable, build: Callable[[], Any]) -> Any:
+        """Get the submenu at path, building and storing it on a miss"""
+        menu = self._menus.get(path)
+        if menu is not None:
+            self._menus.move_to_end(path)
+            self.hits += 1
+            return menu
+
+        self.misses += 1
+        menu = build()
+        self._menus[path] = menu
+        if len(self._menus) > self.max_menus:
+            self._menus.popitem(last=False)
+        return menu
+
+    def clear(self) -> None:
+        """Drop every built submenu (they are rebuilt on next entry)"""
+        self._menus.clear()
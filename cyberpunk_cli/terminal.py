@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Terminal Session - Persistent cbreak mode and mouse reporting
+
+Switching terminal modes per keypress costs several syscalls and lets keys
+typed in between echo onto the screen. A TerminalSession enters cbreak mode
+and enables mouse reporting once, for as long as any menu (or stack of
+nested menus) is running, and restores the terminal on exit, on error and
+on termination signals.
+"""
+
+import os
+import sys
+import atexit
+import signal
+from typing import Dict, Optional
+
+try:
+    import termios
+    import tty
+    TERMIOS_AVAILABLE = True
+except ImportError:
+    TERMIOS_AVAILABLE = False
+
+
+# Click tracking (1000) with SGR coordinates (1006), which work past column 223
+MOUSE_ON = "\x1b[?1000h\x1b[?1006h"
+MOUSE_OFF = "\x1b[?1006l\x1b[?1000l"
+
+# Any-motion tracking: the pointer position is reported even with no button down
+MOTION_ON = "\x1b[?1003h"
+MOTION_OFF = "\x1b[?1003l"
+
+# Bracketed paste: pasted text arrives wrapped in ESC [ 200 ~ ... ESC [ 201 ~
+PASTE_ON = "\x1b[?2004h"
+PASTE_OFF = "\x1b[?2004l"
+
+# Signals that would otherwise leave the terminal in cbreak mode
+_RESTORE_SIGNALS = [getattr(signal, name) for name in ("SIGTERM", "SIGHUP")
+                    if hasattr(signal, name)]
+
+
+class TerminalSession:
+    """Re-entrant context manager holding the terminal in cbreak mode"""
+
+    def __init__(self, mouse: bool = True, motion: bool = False):
+        self.mouse = mouse
+        self.motion = motion  # Also report pointer motion (needs mouse)
+        self.depth = 0
+        self.fd: Optional[int] = None
+        self._saved = None
+        self._previous_handlers: Dict[int, object] = {}
+        self._atexit_registered = False
+
+    @property
+    def active(self) -> bool:
+        """True while the terminal is in cbreak mode"""
+        return self._saved is not None
+
+    def __enter__(self) -> "TerminalSession":
+        self.depth += 1
+        if self.depth == 1:
+            self._start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.depth -= 1
+        if self.depth == 0:
+            self.restore()
+
+    def _start(self) -> None:
+        """Enter cbreak mode and enable mouse reporting"""
+        if not TERMIOS_AVAILABLE:
+            return
+        try:
+            fd = sys.stdin.fileno()
+            if not os.isatty(fd):
+                return
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        except (termios.error, OSError, AttributeError, ValueError):
+            self._saved = None
+            return
+
+        self.fd = fd
+        self._write(self._modes(MOUSE_ON, MOTION_ON, PASTE_ON))
+        self._install_handlers()
+        if not self._atexit_registered:
+            atexit.register(self.restore)
+            self._atexit_registered = True
+
+    def restore(self) -> None:
+        """Put the terminal back the way it was found (safe to call repeatedly)"""
+        if self._saved is None:
+            return
+        saved, self._saved = self._saved, None
+        self._write(self._modes(MOUSE_OFF, MOTION_OFF, PASTE_OFF))
+        try:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, saved)
+        except (termios.error, OSError):
+            pass
+        self._uninstall_handlers()
+
+    def _modes(self, mouse: str, motion: str, paste: str) -> str:
+        """Escape codes switching the enabled reporting modes"""
+        if not self.mouse:
+            return paste
+        return mouse + (motion if self.motion else "") + paste
+
+    def _install_handlers(self) -> None:
+        """Restore the terminal before termination signals take effect"""
+        for signum in _RESTORE_SIGNALS:
+            try:
+                self._previous_handlers[signum] = signal.signal(signum, self._on_signal)
+            except (ValueError, OSError):
+                # Not on the main thread; rely on __exit__/atexit instead
+                break
+
+    def _uninstall_handlers(self) -> None:
+        for signum, handler in self._previous_handlers.items():
+            try:
+                signal.signal(signum, handler)
+            except (ValueError, OSError, TypeError):
+                pass
+        self._previous_handlers = {}
+
+    def _on_signal(self, signum, frame) -> None:
+        previous = self._previous_handlers.get(signum)
+        self.restore()
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            # Re-deliver with the default disposition so the exit status is right
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+
+    def _write(self, data: str) -> None:
+        try:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass
+
+
+# Global terminal session shared by all menus
+terminal_session = TerminalSession()
@@ -1,48 +1,46 @@
 #!/usr/bin/env python3
 """
 Cyberpunk Terminal Menu Themes
-Professional terminal interface theming system with auto-discovery
+Professional terminal interface theming system with lazy loading
+
+Built-in themes are listed in a static manifest and third-party themes are
+discovered through the "cyberpunk_cli.themes" entry point group, e.g.:
+
+    [project.entry-points."cyberpunk_cli.themes"]
+    synthwave = "my_package.synthwave_theme:SynthwaveTheme"
+
+A theme's module is only imported the first time it is selected.
 """
 
-import os
-import importlib
-from pathlib import Path
 from .base_theme import BaseTheme, ThemeManager, theme_manager
 
-# Auto-discover and register all theme classes
-def _discover_themes():
-    """Auto-discover theme classes from *_theme.py files"""
-    themes_dir = Path(__file__).parent
-    
-    for theme_file in themes_dir.glob("*_theme.py"):
-        if theme_file.name == "base_theme.py":
-            continue
-            
-        module_name = theme_file.stem
-        try:
-            module = importlib.import_module(f".{module_name}", package=__name__)
-            
-            # Find theme class (should end with "Theme")
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and 
-                    issubclass(attr, BaseTheme) and 
-                    attr != BaseTheme):
-                    theme_manager.register_theme(attr())
-                    break
-        except ImportError:
-            continue
-
-# Auto-discover themes
-_discover_themes()
-
-# Set default theme
-theme_manager.set_theme("loki")
+# Built-in themes: name -> (class import path, description)
+THEME_MANIFEST = {
+    "loki": ("cyberpunk_cli.themes.loki_theme:LokiTheme",
+             "Nordic mythology terminal interface"),
+    "matrix": ("cyberpunk_cli.themes.matrix_theme:MatrixTheme",
+               "Digital rain interface from The Matrix"),
+    "fallout": ("cyberpunk_cli.themes.fallout_theme:FalloutTheme",
+                "Vault-Tec terminal interface"),
+    "tron": ("cyberpunk_cli.themes.tron_theme:TronTheme",
+             "Neon cyberpunk interface from Tron"),
+}
+
+# Entry point group for third-party themes
+ENTRY_POINT_GROUP = "cyberpunk_cli.themes"
+
+for _name, (_target, _description) in THEME_MANIFEST.items():
+    theme_manager.register_lazy(_name, _target, _description)
+theme_manager.register_entry_points(ENTRY_POINT_GROUP)
+
+# Default theme, loaded on first use
+theme_manager.default_theme = "loki"
 
 __all__ = [
     "BaseTheme",
     "ThemeManager", 
-    "theme_manager"
+    "theme_manager",
+    "THEME_MANIFEST",
 ]
 
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
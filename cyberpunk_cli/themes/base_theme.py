@@ -4,25 +4,55 @@ Base Theme System for Cyberpunk CI Validator
 Professional terminal interface theming system
 """
 
+import importlib
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+from rich.style import Style
 from rich.text import Text
 from rich.panel import Panel
 from rich.align import Align
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+BOLD = Style(bold=True)
 
 
 class BaseTheme(ABC):
-    """Abstract base class for terminal themes"""
+    """Abstract base class for terminal themes
+    
+    Logo, subtitle and footer come in three layout tiers: "full" (the
+    render_logo/render_subtitle/render_footer art), "compact" for narrow
+    or short terminals and "line", one row each at most. Themes override
+    the render_<part>_compact/_line methods they want to customize.
+    """
+    
+    # Smallest terminal (columns, rows) the full and compact chrome are laid out for
+    FULL_LAYOUT = (80, 32)
+    COMPACT_LAYOUT = (40, 16)
     
     def __init__(self):
         self.name = "base"
         self.description = "Base theme class"
+        self._styles = None
         
     @abstractmethod
     def get_colors(self) -> Dict[str, str]:
         """Return theme color palette"""
         pass
     
+    @property
+    def styles(self) -> Mapping[str, Style]:
+        """Palette compiled once into Style objects, plus a bold_<name> variant of each"""
+        styles = getattr(self, "_styles", None)
+        if styles is None:
+            compiled = {}
+            for name, value in self.get_colors().items():
+                style = Style.parse(value)
+                compiled[name] = style
+                compiled[f"bold_{name}"] = style + BOLD
+            styles = self._styles = MappingProxyType(compiled)
+        return styles
+    
     @abstractmethod
     def render_logo(self, console) -> None:
         """Render the main logo/header"""
@@ -43,11 +73,70 @@ class BaseTheme(ABC):
         """Render a section separator"""
         pass
     
+    def render_scroll_indicator(self, first: int, last: int, total: int) -> Text:
+        """Render the scroll position line shown under a scrolled menu"""
+        styles = self.styles
+        above = "▲" if first > 0 else " "
+        below = "▼" if last < total else " "
+        return Text(f"  {above}{below} {first + 1}-{last} of {total}", style=styles["dim"])
+    
+    def render_search_prompt(self, query: str, matches: int) -> Text:
+        """Render the type-to-filter search line"""
+        styles = self.styles
+        prompt = Text("  / ", style=styles["accent"])
+        prompt.append(query + "█", style=styles["primary"])
+        prompt.append(f"   {matches} match{'' if matches == 1 else 'es'}", style=styles["dim"])
+        return prompt
+    
+    def render_breadcrumb(self, titles: List[str]) -> Text:
+        """Render the path line shown at the top of a submenu"""
+        styles = self.styles
+        breadcrumb = Text("  ‹ ", style=styles["accent"])
+        breadcrumb.append(" › ".join(titles), style=styles["primary"])
+        breadcrumb.append("   Esc back", style=styles["dim"])
+        return breadcrumb
+    
     @abstractmethod
     def render_footer(self, console) -> None:
         """Render the footer/controls panel"""
         pass
     
+    def layout_tier(self, width: int, height: int) -> str:
+        """Pick the chrome tier that fits a terminal ("full", "compact" or "line")"""
+        if width >= self.FULL_LAYOUT[0] and height >= self.FULL_LAYOUT[1]:
+            return "full"
+        if width >= self.COMPACT_LAYOUT[0] and height >= self.COMPACT_LAYOUT[1]:
+            return "compact"
+        return "line"
+    
+    def render_logo_compact(self, console) -> None:
+        """Render the logo for narrow or short terminals"""
+        self.render_logo_line(console)
+    
+    def render_logo_line(self, console) -> None:
+        """Render the logo as a single line"""
+        styles = self.styles
+        logo = Text.assemble(("▌ ", styles["accent"]), (self.name.upper(), styles["bold_primary"]),
+                             (f"  {self.description}", styles["dim"]))
+        console.print(logo, no_wrap=True, overflow="ellipsis")
+    
+    def render_subtitle_compact(self, console) -> None:
+        """Render the subtitle for narrow or short terminals (none by default)"""
+        pass
+    
+    def render_subtitle_line(self, console) -> None:
+        """One-line layouts have no subtitle"""
+        pass
+    
+    def render_footer_compact(self, console) -> None:
+        """Render the controls for narrow or short terminals"""
+        self.render_footer_line(console)
+    
+    def render_footer_line(self, console) -> None:
+        """Render the controls as a single line"""
+        hint = Text("  ↑↓ move  Enter run  / search  Esc quit", style=self.styles["dim"])
+        console.print(hint, no_wrap=True, overflow="ellipsis")
+    
     @abstractmethod
     def get_loading_message(self) -> str:
         """Return theme-appropriate loading message"""
@@ -65,31 +154,97 @@ class BaseTheme(ABC):
 
 
 class ThemeManager:
-    """Manages theme loading and switching"""
+    """Manages theme loading and switching
+    
+    Themes can be registered as instances or lazily, by import path. A lazily
+    registered theme's module is only imported the first time it is used.
+    """
     
     def __init__(self):
-        self.themes = {}
+        self.themes = {}                 # Loaded theme instances by name
         self.current_theme = None
+        self.default_theme = None        # Loaded on first get_theme() if none is set
+        self._lazy = {}                  # name -> ("module:Class", description)
+        self._entry_point_groups = []    # Scanned only when a name is not found
         
     def register_theme(self, theme: BaseTheme):
         """Register a new theme"""
         self.themes[theme.name] = theme
+    
+    def register_lazy(self, name: str, target: str, description: str = ""):
+        """Register a theme by "package.module:ClassName" without importing it"""
+        self._lazy[name] = (target, description)
+    
+    def register_entry_points(self, group: str):
+        """Discover third-party themes from an entry point group when needed"""
+        self._entry_point_groups.append(group)
         
     def set_theme(self, theme_name: str):
         """Set the active theme"""
-        if theme_name in self.themes:
-            self.current_theme = self.themes[theme_name]
+        theme = self._load(theme_name)
+        if theme is not None:
+            self.current_theme = theme
             return True
         return False
         
     def get_theme(self) -> BaseTheme:
         """Get the current active theme"""
+        if self.current_theme is None and self.default_theme:
+            self.set_theme(self.default_theme)
         return self.current_theme
         
     def list_themes(self) -> List[str]:
         """List available theme names"""
-        return list(self.themes.keys())
+        self._scan_entry_points()
+        names = list(self._lazy)
+        names.extend(name for name in self.themes if name not in self._lazy)
+        return names
+    
+    def get_description(self, theme_name: str) -> str:
+        """Describe a theme without importing it when possible"""
+        if theme_name in self.themes:
+            return self.themes[theme_name].description
+        self._scan_entry_points()
+        return self._lazy.get(theme_name, ("", ""))[1]
+    
+    def _load(self, theme_name: str) -> Optional[BaseTheme]:
+        """Get a theme instance, importing its module on first use"""
+        if theme_name in self.themes:
+            return self.themes[theme_name]
+        if theme_name not in self._lazy:
+            self._scan_entry_points()
+            if theme_name not in self._lazy:
+                return None
+        
+        target = self._lazy[theme_name][0]
+        module_name, _, class_name = target.partition(":")
+        try:
+            theme_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError):
+            return None
+        theme = theme_class()
+        self.themes[theme_name] = theme
+        return theme
+    
+    def _scan_entry_points(self):
+        """Register themes advertised by installed packages (once per group)"""
+        if not self._entry_point_groups:
+            return
+        groups, self._entry_point_groups = self._entry_point_groups, []
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # Python < 3.8 without importlib.metadata
+            return
+        discovered = entry_points()
+        for group in groups:
+            if hasattr(discovered, "select"):
+                group_entries = discovered.select(group=group)
+            else:
+                group_entries = discovered.get(group, [])
+            for entry in group_entries:
+                if entry.name not in self._lazy and entry.name not in self.themes:
+                    self.register_lazy(entry.name, entry.value)
 
 
 # Global theme manager instance
-theme_manager = ThemeManager()
\ No newline at end of file
+theme_manager = ThemeManager()
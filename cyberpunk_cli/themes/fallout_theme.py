@@ -34,7 +34,7 @@ class FalloutTheme(BaseTheme):
     
     def render_logo(self, console) -> None:
         """Render Vault-Tec style logo"""
-        colors = self.get_colors()
+        styles = self.styles
         
         logo = """
 ╔═══════════════════════════════════════════════════════════════════════════╗
@@ -53,85 +53,110 @@ class FalloutTheme(BaseTheme):
 ║                                                                           ║
 ╚═══════════════════════════════════════════════════════════════════════════╝"""
         
-        console.print(Text(logo, style=colors["primary"]))
+        console.print(Text(logo, style=styles["primary"]))
+    
+    def render_logo_compact(self, console) -> None:
+        """Render the 40-column Vault-Tec logo"""
+        styles = self.styles
+        
+        logo = """
+╔══════════════════════════════════════╗
+║       S M A R T - C I   v2.077       ║
+║  ██████████████████████████████████  ║
+║  █       VAULT-TEC TERMINAL       █  ║
+║  █      [ ACCESS AUTHORIZED ]     █  ║
+║  ██████████████████████████████████  ║
+╚══════════════════════════════════════╝"""
+        
+        console.print(Text(logo, style=styles["primary"]))
     
     def render_subtitle(self, console) -> None:
         """Render Vault-Tec subtitle panel"""
-        colors = self.get_colors()
+        styles = self.styles
         
         subtitle_text = Text()
-        subtitle_text.append("*** ", style=colors["accent"])
-        subtitle_text.append("VAULT-TEC AUTOMATED SYSTEMS", style=f"bold {colors['primary']}")
-        subtitle_text.append(" *** ", style=colors["accent"])
-        subtitle_text.append("CONTINUOUS INTEGRATION PROTOCOL", style=colors["secondary"])
-        subtitle_text.append(" *** ", style=colors["accent"])
-        subtitle_text.append("Build 2.077", style=f"bold {colors['primary']}")
-        subtitle_text.append(" ***", style=colors["accent"])
+        subtitle_text.append("*** ", style=styles["accent"])
+        subtitle_text.append("VAULT-TEC AUTOMATED SYSTEMS", style=styles["bold_primary"])
+        subtitle_text.append(" *** ", style=styles["accent"])
+        subtitle_text.append("CONTINUOUS INTEGRATION PROTOCOL", style=styles["secondary"])
+        subtitle_text.append(" *** ", style=styles["accent"])
+        subtitle_text.append("Build 2.077", style=styles["bold_primary"])
+        subtitle_text.append(" ***", style=styles["accent"])
         
         subtitle = Panel.fit(
             Align.center(subtitle_text),
-            border_style=colors["border"],
+            border_style=styles["border"],
             padding=(0, 1),
-            title=f"[{colors['accent']}]█ ROBCO INDUSTRIES UNIFIED OPERATING SYSTEM █[/{colors['accent']}]",
+            title=Text.assemble(("█ ROBCO INDUSTRIES UNIFIED OPERATING SYSTEM █", styles["accent"])),
             title_align="center"
         )
         console.print(subtitle)
         console.print()
     
+    def render_subtitle_compact(self, console) -> None:
+        """Render the Vault-Tec subtitle as one line"""
+        styles = self.styles
+        
+        subtitle_text = Text()
+        subtitle_text.append("*** ", style=styles["accent"])
+        subtitle_text.append("VAULT-TEC AUTOMATED SYSTEMS", style=styles["bold_primary"])
+        subtitle_text.append(" ***", style=styles["accent"])
+        console.print(subtitle_text, no_wrap=True, overflow="ellipsis")
+    
     def render_menu_item(self, name: str, desc: str, selected: bool) -> Text:
         """Render Fallout-style menu item"""
-        colors = self.get_colors()
+        styles = self.styles
         
         if selected:
-            style = colors["selected"]
+            style = styles["selected"]
             prefix = "> "
             suffix = " <"
-            accent_style = colors["primary"]
+            accent_style = styles["primary"]
         else:
-            style = colors["primary"]
+            style = styles["primary"]
             prefix = "  "
             suffix = "  "
-            accent_style = colors["dim"]
+            accent_style = styles["dim"]
         
         menu_line = Text()
         menu_line.append("  █ ", style=accent_style)
         menu_line.append(f"{prefix}{name:<25}", style=style)
-        menu_line.append(f"{desc}{suffix}", style=style if selected else colors["dim"])
+        menu_line.append(f"{desc}{suffix}", style=style if selected else styles["dim"])
         
         return menu_line
     
     def render_separator(self, title: str = "") -> Text:
         """Render Vault-Tec section separator"""
-        colors = self.get_colors()
+        styles = self.styles
         if title:
-            separator = Text("  █ ", style=colors["success"]) + \
-                       Text("═" * 50 + f" *** {title} *** " + "═" * 15, style=colors["success"])
+            separator = Text("  █ ", style=styles["success"]) + \
+                       Text("═" * 50 + f" *** {title} *** " + "═" * 15, style=styles["success"])
         else:
-            separator = Text("  █ ", style=colors["success"]) + \
-                       Text("═" * 70, style=colors["success"])
+            separator = Text("  █ ", style=styles["success"]) + \
+                       Text("═" * 70, style=styles["success"])
         return separator
     
     def render_footer(self, console) -> None:
         """Render Vault-Tec control panel"""
-        colors = self.get_colors()
+        styles = self.styles
         
         controls = Text()
-        controls.append("*** ", style=colors["accent"])
-        controls.append("TERMINAL CONTROLS", style=f"bold {colors['primary']}")
-        controls.append(" ***  ", style=colors["accent"])
-        controls.append("↑↓", style=colors["success"])
-        controls.append(" Navigate  ", style=colors["secondary"])
-        controls.append("[ENTER]", style=colors["success"])
-        controls.append(" Execute  ", style=colors["secondary"])
-        controls.append("[ESC]", style=colors["warning"])
-        controls.append(" Disconnect  ", style=colors["secondary"])
-        controls.append("[MOUSE]", style=colors["accent"])
-        controls.append(" Point Interface", style=colors["secondary"])
+        controls.append("*** ", style=styles["accent"])
+        controls.append("TERMINAL CONTROLS", style=styles["bold_primary"])
+        controls.append(" ***  ", style=styles["accent"])
+        controls.append("↑↓", style=styles["success"])
+        controls.append(" Navigate  ", style=styles["secondary"])
+        controls.append("[ENTER]", style=styles["success"])
+        controls.append(" Execute  ", style=styles["secondary"])
+        controls.append("[ESC]", style=styles["warning"])
+        controls.append(" Disconnect  ", style=styles["secondary"])
+        controls.append("[MOUSE]", style=styles["accent"])
+        controls.append(" Point Interface", style=styles["secondary"])
         
         footer = Panel.fit(
             Align.center(controls),
-            border_style=colors["border"],
-            title=f"[{colors['accent']}]█ VAULT-TEC INTERFACE PROTOCOL █[/{colors['accent']}]",
+            border_style=styles["border"],
+            title=Text.assemble(("█ VAULT-TEC INTERFACE PROTOCOL █", styles["accent"])),
             title_align="center",
             padding=(0, 1)
         )
@@ -35,7 +35,7 @@ class LokiTheme(BaseTheme):
     
     def render_logo(self, console) -> None:
         """Render Loki-inspired logo"""
-        colors = self.get_colors()
+        styles = self.styles
         
         logo = """
 ╔═══════════════════════════════════════════════════════════════════════════╗
@@ -54,85 +54,111 @@ class LokiTheme(BaseTheme):
 ║                                                                           ║
 ╚═══════════════════════════════════════════════════════════════════════════╝"""
         
-        console.print(Text(logo, style=colors["primary"]))
+        console.print(Text(logo, style=styles["primary"]))
+    
+    def render_logo_compact(self, console) -> None:
+        """Render the 40-column Loki logo"""
+        styles = self.styles
+        
+        logo = """
+╔══════════════════════════════════════╗
+║          L O K I   T E R M           ║
+║  ██████████████████████████████████  ║
+║  █  ASGARD TERMINAL SYSTEM v3.0   █  ║
+║  █     [ TRICKSTER PROTOCOL ]     █  ║
+║  ██████████████████████████████████  ║
+╚══════════════════════════════════════╝"""
+        
+        console.print(Text(logo, style=styles["primary"]))
     
     def render_subtitle(self, console) -> None:
         """Render Loki subtitle panel"""
-        colors = self.get_colors()
+        styles = self.styles
         
         subtitle_text = Text()
-        subtitle_text.append("⚡ ", style=colors["gold"])
-        subtitle_text.append("LOKI TERMINAL INTERFACE", style=f"bold {colors['primary']}")
-        subtitle_text.append(" ⚡ ", style=colors["gold"])
-        subtitle_text.append("SHAPE-SHIFTING PROTOCOLS", style=colors["secondary"])
-        subtitle_text.append(" ⚡ ", style=colors["gold"])
-        subtitle_text.append("Build 3.0", style=f"bold {colors['gold']}")
-        subtitle_text.append(" ⚡", style=colors["gold"])
+        subtitle_text.append("⚡ ", style=styles["gold"])
+        subtitle_text.append("LOKI TERMINAL INTERFACE", style=styles["bold_primary"])
+        subtitle_text.append(" ⚡ ", style=styles["gold"])
+        subtitle_text.append("SHAPE-SHIFTING PROTOCOLS", style=styles["secondary"])
+        subtitle_text.append(" ⚡ ", style=styles["gold"])
+        subtitle_text.append("Build 3.0", style=styles["bold_gold"])
+        subtitle_text.append(" ⚡", style=styles["gold"])
         
         subtitle = Panel.fit(
             Align.center(subtitle_text),
-            border_style=colors["border"],
+            border_style=styles["border"],
             padding=(0, 1),
-            title=f"[{colors['gold']}]⟨ GOD OF MISCHIEF COMPUTING SYSTEM ⟩[/{colors['gold']}]",
+            title=Text.assemble(("⟨ GOD OF MISCHIEF COMPUTING SYSTEM ⟩", styles["gold"])),
             title_align="center"
         )
         console.print(subtitle)
         console.print()
     
+    def render_subtitle_compact(self, console) -> None:
+        """Render the Loki subtitle as one line"""
+        styles = self.styles
+        
+        subtitle_text = Text()
+        subtitle_text.append("⚡ ", style=styles["gold"])
+        subtitle_text.append("LOKI TERMINAL INTERFACE", style=styles["bold_primary"])
+        subtitle_text.append(" ⚡ ", style=styles["gold"])
+        subtitle_text.append("Build 3.0", style=styles["bold_gold"])
+        console.print(subtitle_text, no_wrap=True, overflow="ellipsis")
+    
     def render_menu_item(self, name: str, desc: str, selected: bool) -> Text:
         """Render Loki-style menu item"""
-        colors = self.get_colors()
+        styles = self.styles
         
         if selected:
-            style = colors["selected"]
+            style = styles["selected"]
             prefix = "→ "
             suffix = " ←"
-            accent_style = colors["gold"]
+            accent_style = styles["gold"]
         else:
-            style = colors["primary"]
+            style = styles["primary"]
             prefix = "  "
             suffix = "  "
-            accent_style = colors["dim"]
+            accent_style = styles["dim"]
         
         menu_line = Text()
         menu_line.append("  ▶ ", style=accent_style)
         menu_line.append(f"{prefix}{name:<25}", style=style)
-        menu_line.append(f"{desc}{suffix}", style=style if selected else colors["dim"])
+        menu_line.append(f"{desc}{suffix}", style=style if selected else styles["dim"])
         
         return menu_line
     
     def render_separator(self, title: str = "") -> Text:
         """Render Nordic-style section separator"""
-        colors = self.get_colors()
+        styles = self.styles
         if title:
-            separator = Text("  ▶ ", style=colors["gold"]) + \
-                       Text("═" * 45 + f" ⚡ {title} ⚡ " + "═" * 15, style=colors["gold"])
+            separator = Text("  ▶ ", style=styles["gold"]) + \
+                       Text("═" * 45 + f" ⚡ {title} ⚡ " + "═" * 15, style=styles["gold"])
         else:
-            separator = Text("  ▶ ", style=colors["gold"]) + \
-                       Text("═" * 70, style=colors["gold"])
+            separator = Text("  ▶ ", style=styles["gold"]) + \
+                       Text("═" * 70, style=styles["gold"])
         return separator
     
     def render_footer(self, console) -> None:
         """Render Loki control panel"""
-        colors = self.get_colors()
+        styles = self.styles
         
         controls = Text()
-        controls.append("⚡ ", style=colors["gold"])
-        controls.append("TRICKSTER CONTROLS", style=f"bold {colors['primary']}")
-        controls.append(" ⚡  ", style=colors["gold"])
-        controls.append("↑↓", style=colors["gold"])
-        controls.append(" Navigate  ", style=colors["secondary"])
-        controls.append("[ENTER]", style=colors["gold"])
-        controls.append(" Execute  ", style=colors["secondary"])
-        controls.append("[ESC]", style=colors["warning"])
-        controls.append(" Escape  ", style=colors["secondary"])
-        controls.append("[CTRL+T]", style=colors["accent"])
-        controls.append(" Transform", style=colors["secondary"])
+        controls.append("⚡ ", style=styles["gold"])
+        controls.append("TRICKSTER CONTROLS", style=styles["bold_primary"])
+        controls.append(" ⚡  ", style=styles["gold"])
+        controls.append("↑↓", style=styles["gold"])
+        controls.append(" Navigate  ", style=styles["secondary"])
+        controls.append("[ENTER]", style=styles["gold"])
+        controls.append(" Execute  ", style=styles["secondary"])
+        controls.append("[ESC]", style=styles["warning"])
+        controls.append(" Escape  ", style=styles["secondary"])
+        controls.append("[CTRL+T]", style=styles["accent"])
+        controls.append(" Transform", style=styles["secondary"])
         
         footer = Panel.fit(
             Align.center(controls),
-            border_style=colors["border"],
-            title=f"[{colors['gold']}]⟨ SHAPE-SHIFTER INTERFACE ⟩[/{colors['gold']}]",
+            border_style=styles["border"],
+            title=Text.assemble(("⟨ SHAPE-SHIFTER INTERFACE ⟩", styles["gold"])),
             title_align="center",
             padding=(0, 1)
         )
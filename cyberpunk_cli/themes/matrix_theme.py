@@ -34,7 +34,7 @@ class MatrixTheme(BaseTheme):
     
     def render_logo(self, console) -> None:
         """Render Matrix-style digital logo"""
-        colors = self.get_colors()
+        styles = self.styles
         
         logo = """
 ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░
@@ -49,96 +49,131 @@ class MatrixTheme(BaseTheme):
 ░░░░░░░░░░  [ THE MATRIX HAS YOU... FOLLOW THE WHITE RABBIT ]  ░░░░░░░░░░
 ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░"""
         
-        # Create gradient effect
+        # Create gradient effect (as one Text, printed in a single call)
         lines = logo.split('\n')
+        text = Text()
         for i, line in enumerate(lines):
             if i < 2:
-                style = colors["dim"]
+                style = styles["dim"]
             elif i < 5:
-                style = colors["secondary"] 
+                style = styles["secondary"] 
             elif i < 8:
-                style = colors["primary"]
+                style = styles["primary"]
             else:
-                style = colors["success"]
-            console.print(Text(line, style=style))
+                style = styles["success"]
+            text.append(line, style=style)
+            if i < len(lines) - 1:
+                text.append("\n")
+        console.print(text)
+    
+    def render_logo_compact(self, console) -> None:
+        """Render the 40-column Matrix logo"""
+        styles = self.styles
+        
+        logo = """
+░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░
+▓▓      S M A R T - C I      ▓▓▓▓▓▓▓▓▓▓▓
+▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓
+░░  WELCOME TO THE REAL WORLD  ░░░░░░░░░
+░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░"""
+        
+        gradient = ["dim", "dim", "primary", "secondary", "success", "dim"]
+        lines = logo.split('\n')
+        text = Text()
+        for i, line in enumerate(lines):
+            text.append(line, style=styles[gradient[i]])
+            if i < len(lines) - 1:
+                text.append("\n")
+        console.print(text)
     
     def render_subtitle(self, console) -> None:
         """Render Matrix subtitle panel"""
-        colors = self.get_colors()
+        styles = self.styles
         
         subtitle_text = Text()
-        subtitle_text.append("≋ ", style=colors["accent"])
-        subtitle_text.append("DIGITAL VALIDATION MATRIX", style=f"bold {colors['primary']}")
-        subtitle_text.append(" ≋ ", style=colors["accent"])
-        subtitle_text.append("NEURAL PROCESSING UNIT", style=colors["secondary"])
-        subtitle_text.append(" ≋ ", style=colors["accent"])
-        subtitle_text.append("v0.1101001", style=f"bold {colors['primary']}")
-        subtitle_text.append(" ≋", style=colors["accent"])
+        subtitle_text.append("≋ ", style=styles["accent"])
+        subtitle_text.append("DIGITAL VALIDATION MATRIX", style=styles["bold_primary"])
+        subtitle_text.append(" ≋ ", style=styles["accent"])
+        subtitle_text.append("NEURAL PROCESSING UNIT", style=styles["secondary"])
+        subtitle_text.append(" ≋ ", style=styles["accent"])
+        subtitle_text.append("v0.1101001", style=styles["bold_primary"])
+        subtitle_text.append(" ≋", style=styles["accent"])
         
         subtitle = Panel.fit(
             Align.center(subtitle_text),
-            border_style=colors["border"],
+            border_style=styles["border"],
             padding=(0, 1),
-            title=f"[{colors['accent']}]▓ CONSTRUCT PROGRAM ACTIVE ▓[/{colors['accent']}]",
+            title=Text.assemble(("▓ CONSTRUCT PROGRAM ACTIVE ▓", styles["accent"])),
             title_align="center"
         )
         console.print(subtitle)
         console.print()
     
+    def render_subtitle_compact(self, console) -> None:
+        """Render the Matrix subtitle as one line"""
+        styles = self.styles
+        
+        subtitle_text = Text()
+        subtitle_text.append("≋ ", style=styles["accent"])
+        subtitle_text.append("DIGITAL VALIDATION MATRIX", style=styles["bold_primary"])
+        subtitle_text.append(" ≋ ", style=styles["accent"])
+        subtitle_text.append("v0.1101001", style=styles["bold_primary"])
+        console.print(subtitle_text, no_wrap=True, overflow="ellipsis")
+    
     def render_menu_item(self, name: str, desc: str, selected: bool) -> Text:
         """Render Matrix-style menu item"""
-        colors = self.get_colors()
+        styles = self.styles
         
         if selected:
-            style = colors["selected"]
+            style = styles["selected"]
             prefix = "▶ "
             suffix = " ◀"
-            accent_style = colors["primary"]
+            accent_style = styles["primary"]
         else:
-            style = colors["primary"]
+            style = styles["primary"]
             prefix = "  "
             suffix = "  "
-            accent_style = colors["dim"]
+            accent_style = styles["dim"]
         
         menu_line = Text()
         menu_line.append("  ▓ ", style=accent_style)
         menu_line.append(f"{prefix}{name:<25}", style=style)
-        menu_line.append(f"{desc}{suffix}", style=style if selected else colors["dim"])
+        menu_line.append(f"{desc}{suffix}", style=style if selected else styles["dim"])
         
         return menu_line
     
     def render_separator(self, title: str = "") -> Text:
         """Render Matrix section separator"""
-        colors = self.get_colors()
+        styles = self.styles
         if title:
-            separator = Text("  ▓ ", style=colors["success"]) + \
-                       Text("≋" * 30 + f" ≋ {title} ≋ " + "≋" * 30, style=colors["success"])
+            separator = Text("  ▓ ", style=styles["success"]) + \
+                       Text("≋" * 30 + f" ≋ {title} ≋ " + "≋" * 30, style=styles["success"])
         else:
-            separator = Text("  ▓ ", style=colors["success"]) + \
-                       Text("≋" * 70, style=colors["success"])
+            separator = Text("  ▓ ", style=styles["success"]) + \
+                       Text("≋" * 70, style=styles["success"])
         return separator
     
     def render_footer(self, console) -> None:
         """Render Matrix control panel"""
-        colors = self.get_colors()
+        styles = self.styles
         
         controls = Text()
-        controls.append("≋ ", style=colors["accent"])
-        controls.append("NEURAL INTERFACE", style=f"bold {colors['primary']}")
-        controls.append(" ≋  ", style=colors["accent"])
-        controls.append("↑↓", style=colors["success"])
-        controls.append(" Jack In  ", style=colors["secondary"])
-        controls.append("⟨ENTER⟩", style=colors["success"])
-        controls.append(" Execute  ", style=colors["secondary"])
-        controls.append("⟨ESC⟩", style=colors["warning"])
-        controls.append(" Disconnect  ", style=colors["secondary"])
-        controls.append("⟨MIND⟩", style=colors["accent"])
-        controls.append(" Neural Link", style=colors["secondary"])
+        controls.append("≋ ", style=styles["accent"])
+        controls.append("NEURAL INTERFACE", style=styles["bold_primary"])
+        controls.append(" ≋  ", style=styles["accent"])
+        controls.append("↑↓", style=styles["success"])
+        controls.append(" Jack In  ", style=styles["secondary"])
+        controls.append("⟨ENTER⟩", style=styles["success"])
+        controls.append(" Execute  ", style=styles["secondary"])
+        controls.append("⟨ESC⟩", style=styles["warning"])
+        controls.append(" Disconnect  ", style=styles["secondary"])
+        controls.append("⟨MIND⟩", style=styles["accent"])
+        controls.append(" Neural Link", style=styles["secondary"])
         
         footer = Panel.fit(
             Align.center(controls),
-            border_style=colors["border"],
-            title=f"[{colors['accent']}]▓ DIGITAL REALITY INTERFACE ▓[/{colors['accent']}]",
+            border_style=styles["border"],
+            title=Text.assemble(("▓ DIGITAL REALITY INTERFACE ▓", styles["accent"])),
             title_align="center",
             padding=(0, 1)
         )
@@ -35,7 +35,7 @@ class TronTheme(BaseTheme):
     
     def render_logo(self, console) -> None:
         """Render Tron-style neon logo"""
-        colors = self.get_colors()
+        styles = self.styles
         
         logo = """
 ╔═══════════════════════════════════════════════════════════════════════════╗
@@ -54,98 +54,135 @@ class TronTheme(BaseTheme):
 ║                                                                           ║
 ╚═══════════════════════════════════════════════════════════════════════════╝"""
         
-        # Create neon gradient effect
+        # Create neon gradient effect (as one Text, printed in a single call)
         lines = logo.split('\n')
+        text = Text()
         for i, line in enumerate(lines):
             if i < 3:
-                style = colors["dim"]
+                style = styles["dim"]
             elif i < 6:
-                style = colors["secondary"] 
+                style = styles["secondary"] 
             elif i < 9:
-                style = colors["primary"]
+                style = styles["primary"]
             elif i == 10:
-                style = colors["neon"]
+                style = styles["neon"]
             else:
-                style = colors["success"]
-            console.print(Text(line, style=style))
+                style = styles["success"]
+            text.append(line, style=style)
+            if i < len(lines) - 1:
+                text.append("\n")
+        console.print(text)
+    
+    def render_logo_compact(self, console) -> None:
+        """Render the 40-column Tron logo"""
+        styles = self.styles
+        
+        logo = """
+╔══════════════════════════════════════╗
+║  ░░░░░░░  S M A R T   C I  ░░░░░░░░  ║
+║  ██████████████████████████████████  ║
+║  █  DIGITAL FRONTIER GRID v7.0    █  ║
+║  █  ⬢⬢⬢ WELCOME TO THE GRID ⬢⬢⬢   █  ║
+║  ██████████████████████████████████  ║
+╚══════════════════════════════════════╝"""
+        
+        gradient = ["dim", "dim", "primary", "secondary", "neon", "neon", "secondary", "dim"]
+        lines = logo.split('\n')
+        text = Text()
+        for i, line in enumerate(lines):
+            text.append(line, style=styles[gradient[i]])
+            if i < len(lines) - 1:
+                text.append("\n")
+        console.print(text)
     
     def render_subtitle(self, console) -> None:
         """Render Tron subtitle panel"""
-        colors = self.get_colors()
+        styles = self.styles
         
         subtitle_text = Text()
-        subtitle_text.append("⬢ ", style=colors["neon"])
-        subtitle_text.append("GRID VALIDATION PROTOCOL", style=f"bold {colors['primary']}")
-        subtitle_text.append(" ⬢ ", style=colors["neon"])
-        subtitle_text.append("NEON PROCESSING CORE", style=colors["secondary"])
-        subtitle_text.append(" ⬢ ", style=colors["neon"])
-        subtitle_text.append("Build.7.0", style=f"bold {colors['primary']}")
-        subtitle_text.append(" ⬢", style=colors["neon"])
+        subtitle_text.append("⬢ ", style=styles["neon"])
+        subtitle_text.append("GRID VALIDATION PROTOCOL", style=styles["bold_primary"])
+        subtitle_text.append(" ⬢ ", style=styles["neon"])
+        subtitle_text.append("NEON PROCESSING CORE", style=styles["secondary"])
+        subtitle_text.append(" ⬢ ", style=styles["neon"])
+        subtitle_text.append("Build.7.0", style=styles["bold_primary"])
+        subtitle_text.append(" ⬢", style=styles["neon"])
         
         subtitle = Panel.fit(
             Align.center(subtitle_text),
-            border_style=colors["border"],
+            border_style=styles["border"],
             padding=(0, 1),
-            title=f"[{colors['neon']}]▲ DIGITAL FRONTIER INTERFACE ▲[/{colors['neon']}]",
+            title=Text.assemble(("▲ DIGITAL FRONTIER INTERFACE ▲", styles["neon"])),
             title_align="center"
         )
         console.print(subtitle)
         console.print()
     
+    def render_subtitle_compact(self, console) -> None:
+        """Render the Tron subtitle as one line"""
+        styles = self.styles
+        
+        subtitle_text = Text()
+        subtitle_text.append("⬢ ", style=styles["neon"])
+        subtitle_text.append("GRID VALIDATION PROTOCOL", style=styles["bold_primary"])
+        subtitle_text.append(" ⬢ ", style=styles["neon"])
+        subtitle_text.append("Build.7.0", style=styles["bold_primary"])
+        console.print(subtitle_text, no_wrap=True, overflow="ellipsis")
+    
     def render_menu_item(self, name: str, desc: str, selected: bool) -> Text:
         """Render Tron-style menu item"""
-        colors = self.get_colors()
+        styles = self.styles
         
         if selected:
-            style = colors["selected"]
+            style = styles["selected"]
             prefix = "▶ "
             suffix = " ◀"
-            accent_style = colors["neon"]
+            accent_style = styles["neon"]
         else:
-            style = colors["primary"]
+            style = styles["primary"]
             prefix = "  "
             suffix = "  "
-            accent_style = colors["dim"]
+            accent_style = styles["dim"]
         
         menu_line = Text()
         menu_line.append("  ▲ ", style=accent_style)
         menu_line.append(f"{prefix}{name:<25}", style=style)
-        menu_line.append(f"{desc}{suffix}", style=style if selected else colors["dim"])
+        menu_line.append(f"{desc}{suffix}", style=style if selected else styles["dim"])
         
         return menu_line
     
     def render_separator(self, title: str = "") -> Text:
         """Render Tron section separator"""
-        colors = self.get_colors()
+        styles = self.styles
         if title:
-            separator = Text("  ▲ ", style=colors["success"]) + \
-                       Text("▬" * 30 + f" ⬢ {title} ⬢ " + "▬" * 30, style=colors["success"])
+            separator = Text("  ▲ ", style=styles["success"]) + \
+                       Text("▬" * 30 + f" ⬢ {title} ⬢ " + "▬" * 30, style=styles["success"])
         else:
-            separator = Text("  ▲ ", style=colors["success"]) + \
-                       Text("▬" * 70, style=colors["success"])
+            separator = Text("  ▲ ", style=styles["success"]) + \
+                       Text("▬" * 70, style=styles["success"])
         return separator
     
     def render_footer(self, console) -> None:
         """Render Tron control panel"""
-        colors = self.get_colors()
+        styles = self.styles
         
         controls = Text()
-        controls.append("⬢ ", style=colors["neon"])
-        controls.append("GRID INTERFACE", style=f"bold {colors['primary']}")
-        controls.append(" ⬢  ", style=colors["neon"])
-        controls.append("↑↓", style=colors["success"])
-        controls.append(" Navigate  ", style=colors["secondary"])
-        controls.append("⟨ENTER⟩", style=colors["success"])
-        controls.append(" Execute  ", style=colors["secondary"])
-        controls.append("⟨ESC⟩", style=colors["warning"])
-        controls.append(" Derezzz  ", style=colors["secondary"])
-        controls.append("⟨DISC⟩", style=colors["neon"])
-        controls.append(" Identity Disc", style=colors["secondary"])
+        controls.append("⬢ ", style=styles["neon"])
+        controls.append("GRID INTERFACE", style=styles["bold_primary"])
+        controls.append(" ⬢  ", style=styles["neon"])
+        controls.append("↑↓", style=styles["success"])
+        controls.append(" Navigate  ", style=styles["secondary"])
+        controls.append("⟨ENTER⟩", style=styles["success"])
+        controls.append(" Execute  ", style=styles["secondary"])
+        controls.append("⟨ESC⟩", style=styles["warning"])
+        controls.append(" Derezzz  ", style=styles["secondary"])
+        controls.append("⟨DISC⟩", style=styles["neon"])
+        controls.append(" Identity Disc", style=styles["secondary"])
         
         footer = Panel.fit(
             Align.center(controls),
-            border_style=colors["border"],
-            title=f"[{colors['neon']}]▲ PROGRAM EXECUTION GRID ▲[/{colors['neon']}]",
+            border_style=styles["border"],
+            title=Text.assemble(("▲ PROGRAM EXECUTION GRID ▲", styles["neon"])),
             title_align="center",
             padding=(0, 1)
         )
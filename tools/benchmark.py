@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark suite for cyberpunk-cli
+Drives CyberpunkMenu against an in-memory Rich console for every registered
+theme and a range of menu sizes, measuring frame render time, bytes written
+per frame (also in low-bandwidth mode), navigation throughput and cold
+import time. Results are written
+as JSON and can be compared against a stored baseline.
+"""
+
+import io
+import sys
+import json
+import time
+import platform
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from rich.console import Console
+
+from cyberpunk_cli.menu import CyberpunkMenu
+from cyberpunk_cli.input_source import ScriptedInput
+from cyberpunk_cli.keys import KeyDecoder
+from cyberpunk_cli.themes import theme_manager
+from cyberpunk_cli.render_cache import render_cache
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from check_import_time import measure_import
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+DOWN = '\x1b[B'
+
+# Metrics where a larger value is better (everything else: smaller is better)
+HIGHER_IS_BETTER = {"keys_per_sec", "decode_mb_per_sec", "decode_keys_per_sec"}
+
+# Typical input mix for the decoder benchmark: arrows, paging, mouse, typing
+DECODER_SAMPLE = (b"\x1b[A\x1b[B\x1bOB\x1b[6~\x1b[M !!\x1b[<0;120;40M\x1b[<35;12;7m"
+                  + "type é ✓".encode() + b"\x1b[1;5C\r")
+
+
+def make_console(width: int, height: int, color_system: str) -> Console:
+    """Terminal-like console that writes into memory"""
+    return Console(file=io.StringIO(), force_terminal=True, width=width,
+                   height=height, color_system=color_system)
+
+
+def build_menu(theme: str, size: int, console: Console,
+               low_bandwidth: bool = False) -> CyberpunkMenu:
+    """Menu with size options, a separator after every 8th, and an exit"""
+    menu = CyberpunkMenu(f"Benchmark {size}", theme=theme, max_fps=0,
+                         splash_time=0, execution_delay=0, low_bandwidth=low_bandwidth)
+    menu.console = console
+    menu.renderer.console = console
+    for i in range(size):
+        menu.add_option(f"opt{i}", f"Option {i}", f"Benchmark option number {i}")
+        if i % 8 == 7:
+            menu.add_separator()
+    menu.add_exit()
+    return menu
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench_frames(menu: CyberpunkMenu, frames: int) -> Dict[str, float]:
+    """Time render_menu() while the selection moves down one option per frame"""
+    output = menu.console.file
+    render_cache.clear()
+    menu.renderer.invalidate()
+
+    start = time.perf_counter()
+    position = output.tell()
+    menu.render_menu()
+    first_frame = time.perf_counter() - start
+    first_bytes = len(output.getvalue()) - position
+
+    times, sizes = [], []
+    for _ in range(frames):
+        menu._step(1, wrap=True)
+        position = output.tell()
+        start = time.perf_counter()
+        menu.render_menu()
+        times.append(time.perf_counter() - start)
+        sizes.append(output.tell() - position)
+        output.seek(0)
+        output.truncate()
+
+    return {
+        "first_frame_ms": first_frame * 1000,
+        "first_frame_bytes": first_bytes,
+        "frame_p50_ms": percentile(times, 0.5) * 1000,
+        "frame_p99_ms": percentile(times, 0.99) * 1000,
+        "bytes_per_frame": statistics.mean(sizes),
+    }
+
+
+def bench_repaint(menu: CyberpunkMenu) -> int:
+    """Bytes of a from-scratch repaint after the first frame (as after a resize)"""
+    output = menu.console.file
+    menu.renderer.invalidate()
+    position = output.tell()
+    menu.render_menu()
+    size = output.tell() - position
+    output.seek(0)
+    output.truncate()
+    return size
+
+
+def bench_navigation(menu: CyberpunkMenu, keys: int) -> Dict[str, float]:
+    """Replay keys through run() at full speed, one key per frame, then quit"""
+    menu.input = ScriptedInput([DOWN] * keys + ['q'])
+    start = time.perf_counter()
+    menu.run()
+    elapsed = time.perf_counter() - start
+    menu.console.file.seek(0)
+    menu.console.file.truncate()
+    return {"keys_per_sec": keys / elapsed if elapsed else float("inf")}
+
+
+def bench_decoder(size: int = 1 << 20, chunk: int = 4096) -> Dict[str, float]:
+    """Decode size bytes of mixed input, fed in os.read()-sized chunks"""
+    stream = DECODER_SAMPLE * (size // len(DECODER_SAMPLE) + 1)
+    decoder = KeyDecoder()
+    keys = 0
+    start = time.perf_counter()
+    for position in range(0, len(stream), chunk):
+        keys += len(decoder.feed(stream[position:position + chunk]))
+    keys += len(decoder.flush())
+    elapsed = time.perf_counter() - start
+    return {
+        "decode_mb_per_sec": len(stream) / elapsed / 1e6,
+        "decode_keys_per_sec": keys / elapsed,
+    }
+
+
+def run_suite(sizes: List[int], themes: Optional[List[str]] = None, frames: int = 200,
+              keys: int = 500, width: int = 100, height: int = 50,
+              color_system: str = "truecolor") -> Dict[str, Any]:
+    """Run every benchmark and return the results as a JSON-serializable dict"""
+    results: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "terminal": {"width": width, "height": height, "color_system": color_system},
+        "import": {},
+        "decoder": bench_decoder(),
+        "themes": {},
+    }
+
+    timings = measure_import("cyberpunk_cli")
+    results["import"]["cold_import_ms"] = timings.get("cyberpunk_cli", (0, 0))[1] / 1000
+
+    for theme in themes or theme_manager.list_themes():
+        results["themes"][theme] = {}
+        for size in sizes:
+            console = make_console(width, height, color_system)
+            menu = build_menu(theme, size, console)
+            entry = bench_frames(menu, frames)
+            entry.update(bench_navigation(menu, keys))
+
+            lean = build_menu(theme, size, make_console(width, height, color_system),
+                              low_bandwidth=True)
+            entry["low_bandwidth_bytes_per_frame"] = bench_frames(lean, frames)["bytes_per_frame"]
+            entry["low_bandwidth_repaint_bytes"] = bench_repaint(lean)
+            results["themes"][theme][str(size)] = entry
+            print(f"{theme:>8} {size:>7} options: "
+                  f"frame p50 {entry['frame_p50_ms']:.2f} ms, "
+                  f"{entry['bytes_per_frame']:.0f} B/frame "
+                  f"({entry['low_bandwidth_bytes_per_frame']:.0f} low-bandwidth), "
+                  f"{entry['keys_per_sec']:.0f} keys/s")
+    return results
+
+
+def flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """Flatten nested results into {"themes.loki.1000.frame_p50_ms": value}"""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """List metrics that regressed by more than tolerance against the baseline"""
+    current, previous = flatten(results), flatten(baseline)
+    regressions = []
+    for name, value in sorted(current.items()):
+        old = previous.get(name)
+        if not old or name.startswith("terminal."):
+            continue
+        ratio = value / old
+        if name.rsplit(".", 1)[-1] in HIGHER_IS_BETTER:
+            ratio = 1 / ratio if ratio else float("inf")
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {old:.3f} -> {value:.3f} ({(ratio - 1) * 100:+.0f}%)")
+    return regressions
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark cyberpunk-cli rendering and navigation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Menu sizes to test")
+    parser.add_argument("--themes", nargs="+", help="Themes to test (default: all registered)")
+    parser.add_argument("--frames", type=int, default=200, help="Frames rendered per measurement")
+    parser.add_argument("--keys", type=int, default=500, help="Keys pushed through run() per measurement")
+    parser.add_argument("--width", type=int, default=100, help="Console width")
+    parser.add_argument("--height", type=int, default=50, help="Console height")
+    parser.add_argument("--color-system", default="truecolor", help="standard, 256 or truecolor")
+    parser.add_argument("--output", default="benchmark.json", help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression (0.2 = 20%%)")
+
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.themes, args.frames, args.keys,
+                        args.width, args.height, args.color_system)
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
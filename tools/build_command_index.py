@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Command index builder for cyberpunk-cli
+Imports a Click app's root command ("package.module:attr"), loads or builds
+its command index the way the menu does, and reports how long that took,
+how big the tree is and which modules had to be extracted. Run it after
+installing to build the index ahead of the first menu, or with --rebuild
+to start over.
+"""
+
+import sys
+import time
+import importlib
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cyberpunk_cli.command_index import CommandIndex
+
+
+def import_command(target: str):
+    """Import "package.module:attr" and return the command it names"""
+    module_name, _, attribute = target.partition(":")
+    if not attribute:
+        raise SystemExit(f"Expected package.module:attr, got {target!r}")
+    command = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        command = getattr(command, part)
+    return command
+
+
+def count_commands(entry: Dict[str, Any]) -> Tuple[int, int]:
+    """(groups, leaf commands) in a tree, the root included"""
+    children = entry["commands"]
+    if children is None:
+        return 0, 1
+    groups, leaves = 1, 0
+    for child in children.values():
+        child_groups, child_leaves = count_commands(child)
+        groups += child_groups
+        leaves += child_leaves
+    return groups, leaves
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or refresh the command index of a Click app")
+    parser.add_argument("target", help="Root command as package.module:attr")
+    parser.add_argument("--path", help="Index file (default: the user cache directory)")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the stored index")
+
+    args = parser.parse_args()
+
+    command = import_command(args.target)
+    index = CommandIndex(command, args.path)
+    start = time.perf_counter()
+    tree = index.rebuild() if args.rebuild else index.load()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    groups, leaves = count_commands(tree)
+    print(f"{args.target}: {groups} groups, {leaves} commands from {len(index.modules)} modules")
+    print(f"  {'rebuilt' if args.rebuild else 'loaded'} in {elapsed:.1f} ms, "
+          f"{len(index.extracted)} modules extracted")
+    print(f"  index: {index.path}")
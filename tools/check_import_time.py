@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for cyberpunk-cli
+Runs a cold "import cyberpunk_cli" under python -X importtime, the way a CLI
+invoked with arguments would, and fails when it is over budget or when it
+pulls in the rendering stack (Rich) or Click
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules a CLI invoked with arguments should not pay for
+FORBIDDEN_MODULES = ["rich", "click", "cyberpunk_cli.menu", "cyberpunk_cli.themes"]
+
+
+def measure_import(module: str = "cyberpunk_cli") -> Dict[str, Tuple[int, int]]:
+    """Import module in a fresh interpreter, return {name: (self_us, cumulative_us)}"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    # The extra argument makes sys.argv look like a CLI called with arguments
+    command = [sys.executable, "-X", "importtime", "-c",
+               f"import {module}", "--version"]
+    result = subprocess.run(command, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        timings[name] = (int(fields[0]), int(fields[1]))
+    return timings
+
+
+def check_import(budget_ms: float, module: str = "cyberpunk_cli", runs: int = 5) -> bool:
+    """Check the best of several cold imports against the budget"""
+    best = None
+    loaded: List[str] = []
+    for _ in range(runs):
+        timings = measure_import(module)
+        cumulative = timings.get(module, (0, 0))[1] / 1000
+        best = cumulative if best is None else min(best, cumulative)
+        loaded = [name for name in timings
+                  if any(name == forbidden or name.startswith(forbidden + ".")
+                         for forbidden in FORBIDDEN_MODULES)]
+
+    ok = True
+    print(f"import {module}: {best:.1f} ms (budget {budget_ms:.1f} ms, best of {runs})")
+    if best > budget_ms:
+        print("  FAIL: over budget")
+        ok = False
+    if loaded:
+        print(f"  FAIL: eagerly imported {', '.join(sorted(loaded))}")
+        ok = False
+    if ok:
+        print("  OK")
+    return ok
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check the cold import time of cyberpunk-cli")
+    parser.add_argument("--budget", type=float, default=50.0, help="Budget in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold imports to take the best of")
+    parser.add_argument("--module", default="cyberpunk_cli", help="Module to import")
+
+    args = parser.parse_args()
+
+    sys.exit(0 if check_import(args.budget, args.module, args.runs) else 1)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Fuzz tester for the cyberpunk-cli key decoder
+Feeds random mixes of keys, escape sequences, mouse reports, pastes, UTF-8
+and raw garbage to KeyDecoder, split into random chunks, and checks that
+it never raises, never returns empty keys, always drains its buffer on
+flush, and decodes the same keys however the input is chunked.
+"""
+
+import sys
+import random
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cyberpunk_cli.keys import KeyDecoder, MAX_SEQUENCE
+
+# Well-formed pieces a real terminal sends
+SAMPLES = [
+    b"a", b"q", b"/", b"\r", b"\x7f", b"\x1b[A", b"\x1b[B", b"\x1bOA", b"\x1b[5~",
+    b"\x1b[6~", b"\x1b[1;5C", b"\x1b[15~", b"\x1bOP", b"\x1b[M !!", b"\x1b[M\xff\xff\xff",
+    b"\x1b[<0;12;5M", b"\x1b[<35;230;61m", b"\x1b[200~pasted text\r\n\x1b[201~",
+    "é".encode(), "✓".encode(), "🙂".encode(), b"\x1bx", b"\x1b\x1b",
+]
+
+
+def random_stream(rng: random.Random, pieces: int) -> bytes:
+    """Mostly well-formed input with truncated sequences and garbage mixed in"""
+    stream = bytearray()
+    for _ in range(pieces):
+        roll = rng.random()
+        if roll < 0.7:
+            stream += rng.choice(SAMPLES)
+        elif roll < 0.85:
+            sample = rng.choice(SAMPLES)
+            stream += sample[:rng.randint(1, len(sample))]  # Truncated
+        else:
+            stream += bytes(rng.randrange(256) for _ in range(rng.randint(1, 8)))
+    return bytes(stream)
+
+
+def decode(stream: bytes, chunks: List[int]) -> List[str]:
+    """Decode stream fed in chunks of the given sizes, flushing at the end"""
+    decoder = KeyDecoder()
+    keys, position = [], 0
+    for size in chunks:
+        keys.extend(decoder.feed(stream[position:position + size]))
+        position += size
+    keys.extend(decoder.feed(stream[position:]))
+    keys.extend(decoder.flush())
+    if decoder.pending and not decoder.in_paste:
+        raise AssertionError("flush() left bytes buffered")
+    return keys
+
+
+def fuzz(iterations: int, seed: int) -> int:
+    """Run the fuzz loop, returning the number of failures"""
+    rng = random.Random(seed)
+    failures = 0
+    for iteration in range(iterations):
+        stream = random_stream(rng, rng.randint(1, 40))
+        chunks = []
+        while sum(chunks) < len(stream):
+            chunks.append(rng.randint(1, 16))
+        try:
+            whole = decode(stream, [])
+            split = decode(stream, chunks)
+            bytewise = decode(stream, [1] * len(stream))
+            if any(not key for key in whole):
+                raise AssertionError("empty key")
+            if whole != split or whole != bytewise:
+                raise AssertionError(f"chunking changed the result:\n  {whole!r}\n  {split!r}")
+            if any(key.startswith('\x1b[') and len(key) > MAX_SEQUENCE + 1
+                   and not key.startswith('\x1b[200~') for key in whole):
+                raise AssertionError("over-long sequence")
+        except Exception as error:
+            failures += 1
+            print(f"FAIL iteration {iteration}: {error}")
+            print(f"  input: {stream!r}")
+            if failures >= 10:
+                break
+    return failures
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fuzz the cyberpunk-cli key decoder")
+    parser.add_argument("--iterations", type=int, default=20000, help="Number of random streams")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    args = parser.parse_args()
+
+    failures = fuzz(args.iterations, args.seed)
+    print(f"{args.iterations} streams, {failures} failures")
+    sys.exit(1 if failures else 0)
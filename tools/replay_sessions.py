@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Session replays for cyberpunk-cli
+Runs menus through scripted sessions in real time (ScriptedInput with
+realtime=True, so keys due within a frame are applied together as on a
+terminal) and checks what run() returns and that the screen showed what
+it should. Each session reproduces a bug that once broke the menu.
+"""
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cyberpunk_cli import CyberpunkMenu
+from cyberpunk_cli.input_source import ScriptedInput
+
+
+def typed(text: str, start: float, step: float = 0.02) -> List[Tuple[float, str]]:
+    """Events typing text one key every step seconds from start"""
+    return [(start + step * n, key) for n, key in enumerate(text)]
+
+
+class Session(NamedTuple):
+    menu: CyberpunkMenu
+    events: List[Tuple[float, str]]
+    result: Optional[str]   # What run() must return
+    shown: str              # Text some frame must have shown
+
+
+def live_menu(count: int, renamed: int) -> CyberpunkMenu:
+    """Menu of live options "match <i>", the renamed one changing after 0.3 s"""
+    menu = CyberpunkMenu("Replay", "tron", splash_time=0, execution_delay=0)
+    started = time.monotonic()
+    for i in range(count):
+        def name(i=i):
+            if i == renamed and time.monotonic() - started > 0.3:
+                return "renamed"
+            return f"match {i}"
+        menu.add_live_option(f"live{i}", name, "Live option", interval=0.05)
+    return menu
+
+
+def live_option_leaves_search() -> Session:
+    """A shown live option stops matching the active search
+
+    The filtered list shrinks under the last frame, whose rows must not be
+    looked up in it by their old positions.
+    """
+    events = typed("/match", 0.05) + [(0.6, '\r')]
+    return Session(live_menu(10, 9), events, "live0", "9 matches")
+
+
+def hidden_option_leaves_search() -> Session:
+    """A live option below the viewport stops matching the active search
+
+    No shown row changed, but the match count did: the menu must repaint.
+    """
+    events = typed("/match", 0.05) + [(0.6, '\r')]
+    return Session(live_menu(60, 59), events, "live0", "59 matches")
+
+
+SESSIONS: List[Callable[[], Session]] = [
+    live_option_leaves_search,
+    hidden_option_leaves_search,
+]
+
+
+def replay(session) -> Optional[str]:
+    """Run one session, returning an error message if it failed"""
+    menu, events, expected, shown = session()
+    menu.input = ScriptedInput(events, realtime=True)
+    screen = io.StringIO()
+    try:
+        with redirect_stdout(screen):
+            result = menu.run()
+    except Exception as error:
+        return f"raised {type(error).__name__}: {error}"
+    if result != expected:
+        return f"returned {result!r}, expected {expected!r}"
+    if shown not in screen.getvalue():
+        return f"never showed {shown!r}"
+    return None
+
+
+if __name__ == "__main__":
+    failures = 0
+    for session in SESSIONS:
+        error = replay(session)
+        print(f"{'FAIL' if error else 'ok  '} {session.__name__}{f': {error}' if error else ''}")
+        failures += bool(error)
+    print(f"{len(SESSIONS)} sessions, {failures} failures")
+    sys.exit(1 if failures else 0)